@@ -22,6 +22,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
 from fastapi import FastAPI  # type: ignore
 from fastapi.middleware.cors import CORSMiddleware  # type: ignore
+from fastapi.middleware.gzip import GZipMiddleware  # type: ignore
 
 from config import DATABASE_PATH, API_HOST, API_PORT  # type: ignore
 from app.database.init_db import initialize_database, get_connection  # type: ignore
@@ -123,6 +124,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON payloads (ranking results, bias reports); requests
+# sends Accept-Encoding: gzip by default, so the UI needs no change
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # ==============================================================================
 # Routers
 # ==============================================================================
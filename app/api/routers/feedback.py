@@ -7,7 +7,7 @@ from typing import Optional, Any
 from fastapi import APIRouter, Depends, HTTPException, status  # type: ignore
 
 from app.api.dependencies import get_db  # type: ignore
-from app.schemas.models import FeedbackCreate  # type: ignore
+from app.schemas.models import FeedbackCreate, FeedbackBulkCreate  # type: ignore
 from app.services.feedback_service import (  # type: ignore
     store_feedback,
     get_feedback_stats,
@@ -28,6 +28,48 @@ def submit_feedback(
     After every FEEDBACK_THRESHOLD submissions for a job, scoring weights
     are automatically adjusted via EMA learning.
     """
+    # The decision is committed before the weight-adjustment step, so a failure
+    # there cannot lose it
+    return _record_feedback(db, payload, commit=True)
+
+
+@router.post("/bulk")
+def submit_feedback_bulk(
+    payload: FeedbackBulkCreate,
+    db: sqlite3.Connection = Depends(get_db),
+):
+    """
+    Submit several feedback decisions in one request and one transaction;
+    the final commit is the only one, including any weight adjustments.
+
+    Items are processed in order, so weight adjustment triggers exactly as it
+    would for the same sequence of single submissions. An item whose ranking
+    does not exist is reported with status "error" without failing the batch.
+    """
+    results = []
+    weights_triggered = False
+    for item in payload.items:
+        try:
+            response = _record_feedback(db, item, commit=False)
+        except HTTPException as e:
+            results.append({"ranking_id": item.ranking_id, "status": "error", "detail": e.detail})
+            continue
+        weights_triggered = weights_triggered or response["weight_adjustment_triggered"]
+        results.append({"ranking_id": item.ranking_id, "status": "ok", **response})
+    db.commit()
+
+    return {
+        "recorded": sum(1 for r in results if r["status"] == "ok"),
+        "weight_adjustment_triggered": weights_triggered,
+        "results": results,
+    }
+
+
+def _record_feedback(db: sqlite3.Connection, payload: FeedbackCreate, commit: bool) -> dict[str, Any]:
+    """
+    Store one feedback entry and run the weight-adjustment check.
+    With commit=False nothing is committed; the caller commits the batch.
+    """
     # Validate ranking exists and fetch job_id + resume_id
     ranking_row = db.execute(
         "SELECT id, job_id, resume_id FROM rankings WHERE id = ?",
@@ -51,12 +93,13 @@ def submit_feedback(
         resume_id=resume_id,
         decision=payload.decision,
         notes=payload.notes,
+        commit=commit,
     )
 
     # Check if weight adjustment should be triggered
-    new_weights = maybe_trigger_weight_adjustment(db, job_id)
+    new_weights = maybe_trigger_weight_adjustment(db, job_id, commit=commit)
 
-    response = {
+    response: dict[str, Any] = {
         "message": "Feedback recorded",
         "feedback_id": feedback_id,
         "job_id": job_id,
@@ -3,17 +3,20 @@ app/api/routers/ranking.py — Candidate ranking endpoints.
 
 POST /rank/{job_id}       → Run multi-factor ranking of all resumes vs this job
 GET  /rank/{job_id}/results → Fetch the most recent saved rankings for a job
+                              (?include=feedback_stats adds the job's feedback summary)
 """
 
 import json
 import sqlite3
 from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status  # type: ignore
 
 from app.api.dependencies import get_db  # type: ignore
 from app.services.ranking_service import rank_candidates  # type: ignore
 from app.services.explainability_service import generate_explanations_for_ranking  # type: ignore
 from app.services.embedding_service import get_embedding_service  # type: ignore
+from app.services.feedback_service import get_feedback_stats  # type: ignore
 
 router = APIRouter()
 
@@ -35,8 +38,9 @@ def _save_rankings(
     db: sqlite3.Connection,
     job_id: int,
     ranked: list[dict],
+    weights: dict,
 ) -> None:
-    """Persist ranking results to the rankings table."""
+    """Persist ranking results, with the weights they were scored with, to the rankings table."""
     # Clear previous rankings for this job
     db.execute("DELETE FROM rankings WHERE job_id = ?", (job_id,))
 
@@ -46,8 +50,8 @@ def _save_rankings(
             INSERT INTO rankings
               (job_id, resume_id, rank, total_score,
                score_breakdown_json, matched_skills_json,
-               missing_skills_json, explanation, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+               missing_skills_json, explanation, weights_json, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
             (
                 job_id,
@@ -58,6 +62,7 @@ def _save_rankings(
                 json.dumps(candidate.get("matched_skills", [])),
                 json.dumps(candidate.get("missing_skills", [])),
                 candidate.get("explanation", ""),
+                json.dumps(weights),
                 datetime.utcnow().isoformat(),
             ),
         )
@@ -106,7 +111,7 @@ def run_ranking(job_id: int, skills_priority: bool = False, db: sqlite3.Connecti
     )
 
     # Persist
-    _save_rankings(db, job_id, ranked)
+    _save_rankings(db, job_id, ranked, weights)
 
     return {
         "job_id": job_id,
@@ -119,9 +124,18 @@ def run_ranking(job_id: int, skills_priority: bool = False, db: sqlite3.Connecti
 
 
 @router.get("/{job_id}/results")
-def get_ranking_results(job_id: int, db: sqlite3.Connection = Depends(get_db)):
-    """Fetch the most recent saved ranking for a job (without re-running)."""
-    job_row = db.execute("SELECT id, title FROM jobs WHERE id = ?", (job_id,)).fetchone()
+def get_ranking_results(
+    job_id: int,
+    include: Optional[str] = None,
+    db: sqlite3.Connection = Depends(get_db),
+):
+    """
+    Fetch the most recent saved ranking for a job (without re-running).
+
+    `include` is a comma-separated list of extras to embed in the same
+    payload; currently only "feedback_stats" is supported.
+    """
+    job_row = db.execute("SELECT id, title, weights_json FROM jobs WHERE id = ?", (job_id,)).fetchone()
     if not job_row:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
@@ -157,12 +171,19 @@ def get_ranking_results(job_id: int, db: sqlite3.Connection = Depends(get_db)):
             "created_at": row["created_at"],
         })
 
-    return {
+    response = {
         "job_id": job_id,
         "job_title": job_row["title"],
         "candidate_count": len(candidates),
+        # Rows saved before rankings stored their weights fall back to the job's current ones
+        "weights_used": json.loads(ranking_rows[0]["weights_json"] or job_row["weights_json"]),
         "ranked_candidates": candidates,
+        "generated_at": candidates[0]["created_at"],
     }
+    extras = {part.strip() for part in (include or "").split(",")}
+    if "feedback_stats" in extras:
+        response["feedback_stats"] = get_feedback_stats(db, job_id=job_id)
+    return response
 
 
 @router.get("/{job_id}/report.pdf")
@@ -12,7 +12,7 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, s
 from fastapi.responses import StreamingResponse  # type: ignore
 
 from app.api.dependencies import get_db  # type: ignore
-from app.services.resume_parser import parse_resume_file, parse_resume_text  # type: ignore
+from app.services.resume_parser import PARSE_ERRORS, parse_resume_file, parse_resume_text  # type: ignore
 from app.services.skill_extractor import get_skill_extractor  # type: ignore
 from app.services.embedding_service import get_embedding_service  # type: ignore
 from app.services.report_service import report_service  # type: ignore
@@ -79,6 +79,12 @@ async def upload_resume(
 
     try:
         parsed = parse_resume_file(tmp_path)
+    except PARSE_ERRORS:
+        # Unreadable input is the client's problem; anything else stays a 500
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Could not parse {file.filename}",
+        )
     finally:
         tmp_path.unlink(missing_ok=True)
 
@@ -139,6 +145,25 @@ async def upload_resume(
     }
 
 
+@router.post("/upload-batch")
+async def upload_resume_batch(
+    files: list[UploadFile] = File(...),
+    db: sqlite3.Connection = Depends(get_db),
+):
+    """
+    Upload several resume files in one multipart request.
+    Each file goes through the same pipeline as /upload; a bad file is
+    reported in `failed` without aborting the rest of the batch.
+    """
+    uploaded, failed = [], []
+    for file in files:
+        try:
+            uploaded.append(await upload_resume(file=file, db=db))
+        except HTTPException as e:
+            failed.append({"file_name": file.filename, "detail": e.detail})
+    return {"uploaded": uploaded, "failed": failed}
+
+
 @router.post("/upload-text", status_code=status.HTTP_201_CREATED)
 async def upload_resume_text(
     name: str = Form(...),
@@ -45,6 +45,7 @@ CREATE TABLE IF NOT EXISTS rankings (
     matched_skills_json  TEXT NOT NULL,  -- JSON: list of matched skills
     missing_skills_json  TEXT NOT NULL,  -- JSON: list of missing required skills
     explanation         TEXT NOT NULL,
+    weights_json        TEXT,            -- JSON: weights this ranking run was scored with
     created_at          DATETIME DEFAULT CURRENT_TIMESTAMP
 );
 """
@@ -89,6 +90,13 @@ ALL_TABLES = [
     ("weight_history", CREATE_WEIGHT_HISTORY_TABLE),
 ]
 
+# Columns added after a table's first release: (table, column, type).
+# CREATE TABLE IF NOT EXISTS leaves existing databases alone, so these are
+# added on startup when missing.
+ADDED_COLUMNS = [
+    ("rankings", "weights_json", "TEXT"),
+]
+
 
 def get_connection(db_path: Path) -> sqlite3.Connection:
     """Return a SQLite connection with foreign key enforcement enabled."""
@@ -111,6 +119,11 @@ def initialize_database(db_path: Path) -> None:
             for table_name, ddl in ALL_TABLES:
                 conn.execute(ddl)
                 logger.debug(f"Table ensured: {table_name}")
+            for table_name, column, col_type in ADDED_COLUMNS:
+                existing = {row["name"] for row in conn.execute(f"PRAGMA table_info({table_name})")}
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE {table_name} ADD COLUMN {column} {col_type}")
+                    logger.info(f"Column added: {table_name}.{column}")
         logger.info(f"Database initialized at: {db_path}")
     finally:
         conn.close()
@@ -175,6 +175,11 @@ class FeedbackCreate(BaseModel):
         return v
 
 
+class FeedbackBulkCreate(BaseModel):
+    """Several recruiter feedback submissions sent in one request."""
+    items: list[FeedbackCreate] = Field(min_length=1, max_length=500)
+
+
 class FeedbackRecord(BaseModel):
     id: int
     ranking_id: int
@@ -211,6 +216,7 @@ class BiasSignal(BaseModel):
     severity: str       # "low" | "medium" | "high"
     description: str
     affected_candidates: list[int]  # resume_ids
+    affected_names: str = ""        # comma-separated candidate names
 
 
 class BiasReport(BaseModel):
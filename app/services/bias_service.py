@@ -220,6 +220,10 @@ def _identify_bias_signals(
                 "affected_candidates": [],
             })
 
+    # Pre-joined names so clients can interpolate without rebuilding the list
+    for signal in signals:
+        signal["affected_names"] = ", ".join(a["name"] for a in signal["affected_candidates"])
+
     return signals
 
 
@@ -44,10 +44,12 @@ def store_feedback(
     resume_id: int,
     decision: str,
     notes: Optional[str] = None,
+    commit: bool = True,
 ) -> int:
     """
     Persist a recruiter feedback entry to the database.
-    Returns the new feedback row id.
+    Returns the new feedback row id. Pass commit=False to batch several
+    entries into one transaction; the caller then commits.
     """
     cursor = conn.execute(
         """
@@ -56,7 +58,8 @@ def store_feedback(
         """,
         (ranking_id, job_id, resume_id, decision, notes, datetime.utcnow().isoformat()),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
     feedback_id = cursor.lastrowid
     logger.info(
         f"Feedback stored | id={feedback_id} | job_id={job_id} "
@@ -222,6 +225,7 @@ def _save_updated_weights(
     job_id: int,
     weights: dict[str, float],
     trigger: str = "feedback",
+    commit: bool = True,
 ) -> None:
     """Persist updated weights to job record and weight_history audit log."""
     weights_json = json.dumps(weights)
@@ -237,19 +241,22 @@ def _save_updated_weights(
         """,
         (job_id, weights_json, trigger, datetime.utcnow().isoformat()),
     )
-    conn.commit()
+    if commit:
+        conn.commit()
     logger.info(f"Weights saved for job_id={job_id}: {weights}")
 
 
 def maybe_trigger_weight_adjustment(
     conn: sqlite3.Connection,
     job_id: int,
+    commit: bool = True,
 ) -> Optional[dict[str, float]]:
     """
     Check if enough feedback has accumulated to trigger weight adjustment.
     If yes, compute and persist new weights. Returns new weights or None.
 
-    Called after every feedback submission.
+    Called after every feedback submission. Pass commit=False when the
+    caller owns the transaction.
     """
     # pyre-ignore[21]: Pyre fails to resolve root config
     from config import FEEDBACK_THRESHOLD, WEIGHT_LEARNING_RATE, MIN_WEIGHT, MAX_WEIGHT
@@ -307,5 +314,5 @@ def maybe_trigger_weight_adjustment(
         max_weight=MAX_WEIGHT,
     )
 
-    _save_updated_weights(conn, job_id, new_weights, trigger="feedback")
+    _save_updated_weights(conn, job_id, new_weights, trigger="feedback", commit=commit)
     return new_weights
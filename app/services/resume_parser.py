@@ -10,6 +10,7 @@ No ML model dependency — keeps this service fast and testable.
 
 import re
 import logging
+import zipfile
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
@@ -34,6 +35,16 @@ except ImportError:
     DOCX_AVAILABLE = False
     logger.warning("python-docx not installed — DOCX parsing unavailable")
 
+# Errors the extractors raise for unreadable input (corrupt PDFs, legacy or
+# damaged Word files, unsupported extensions), as opposed to bugs
+PARSE_ERRORS: tuple = (ValueError, zipfile.BadZipFile)
+if PYMUPDF_AVAILABLE:
+    PARSE_ERRORS += (fitz.FileDataError,)
+if DOCX_AVAILABLE:
+    # pyre-ignore[21]: Pyre fails to resolve optional dependency docx
+    from docx.opc.exceptions import OpcError
+    PARSE_ERRORS += (OpcError,)
+
 
 # ---------------------------------------------------------------------------
 # Section header patterns (case-insensitive)
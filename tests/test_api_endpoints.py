@@ -62,6 +62,14 @@ class TestHealthEndpoint:
         assert resp.json()["status"] == "ok"
 
 
+class TestCompression:
+    def test_large_responses_are_gzipped(self, client):
+        resp = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in small.headers
+
+
 class TestResumeEndpoints:
     def test_upload_text_resume(self, client):
         resp = client.post(
@@ -74,6 +82,36 @@ class TestResumeEndpoints:
         assert "resume_id" in data
         assert data["candidate_name"] == "Test Candidate"
 
+    def test_upload_batch(self, client):
+        resp = client.post("/resumes/upload-batch", files=[
+            ("files", ("alice.txt", b"Alice Smith\nPython developer with 4 years experience. Skills: Python, SQL.", "text/plain")),
+            ("files", ("notes.xyz", b"not a resume", "application/octet-stream")),
+        ])
+        assert resp.status_code == 200
+        data = resp.json()
+        assert len(data["uploaded"]) == 1
+        assert "resume_id" in data["uploaded"][0]
+        assert data["failed"][0]["file_name"] == "notes.xyz"
+        assert client.get("/resumes/").json()["total"] == 1
+
+    def test_upload_batch_corrupt_pdf(self, client):
+        resp = client.post("/resumes/upload-batch", files=[
+            ("files", ("alice.txt", b"Alice Smith\nPython developer with 4 years experience. Skills: Python, SQL.", "text/plain")),
+            ("files", ("bad.pdf", b"%PDF-1.4 not really a pdf", "application/pdf")),
+            ("files", ("old.doc", b"\xd0\xcf\x11\xe0 legacy word file", "application/msword")),
+        ])
+        assert resp.status_code == 200
+        data = resp.json()
+        assert len(data["uploaded"]) == 1
+        assert [f["file_name"] for f in data["failed"]] == ["bad.pdf", "old.doc"]
+        assert data["failed"][0]["detail"] == "Could not parse bad.pdf"
+        assert client.get("/resumes/").json()["total"] == 1
+
+    def test_upload_parser_bug_is_not_reported_as_bad_input(self, client):
+        with patch("app.api.routers.resumes.parse_resume_file", side_effect=KeyError("bug")):
+            with pytest.raises(KeyError):
+                client.post("/resumes/upload", files={"file": ("a.txt", b"text", "text/plain")})
+
     def test_list_resumes_empty(self, client):
         resp = client.get("/resumes/")
         assert resp.status_code == 200
@@ -189,3 +227,65 @@ class TestRankingEndpoints:
         resp = client.get(f"/rank/{job['job_id']}/results")
         assert resp.status_code == 200
         assert len(resp.json()["ranked_candidates"]) >= 1
+        assert "skill_match" in resp.json()["weights_used"]
+        assert resp.json()["generated_at"]
+        assert "feedback_stats" not in resp.json()
+
+        rid = resp.json()["ranked_candidates"][0]["ranking_id"]
+        client.post("/feedback/", json={"ranking_id": rid, "decision": "accept"})
+        resp = client.get(f"/rank/{job['job_id']}/results", params={"include": "feedback_stats"})
+        assert resp.json()["feedback_stats"]["total_feedback"] == 1
+
+    def test_results_report_the_weights_the_run_used(self, client, test_db):
+        job = client.post("/jobs/", json={
+            "title": "Weighted Role",
+            "description": "Python developer needed. Required: Python. 1 year experience."
+        }).json()
+        client.post("/resumes/upload-text", data={
+            "name": "Dev", "raw_text": "Python developer 2 years. Skills: Python, SQL."
+        })
+        ran_with = client.post(f"/rank/{job['job_id']}").json()["weights_used"]
+        # A later weight adjustment must not relabel the stored run
+        test_db.execute("UPDATE jobs SET weights_json = ? WHERE id = ?",
+                        (json.dumps({"skill_match": .9, "experience_alignment": .05, "role_relevance": .05}), job["job_id"]))
+        resp = client.get(f"/rank/{job['job_id']}/results")
+        assert resp.json()["weights_used"] == ran_with
+
+
+class TestFeedbackEndpoints:
+    def _ranked(self, client):
+        job = client.post("/jobs/", json={
+            "title": "Backend Role",
+            "description": "Backend developer needed. Required: Python, SQL. 2 years experience."
+        }).json()
+        client.post("/resumes/upload-text", data={
+            "name": "Dev", "raw_text": "Python developer 3 years. Skills: Python, SQL."
+        })
+        client.post(f"/rank/{job['job_id']}")
+        return client.get(f"/rank/{job['job_id']}/results").json()["ranked_candidates"]
+
+    def test_bulk_feedback_records_items(self, client):
+        rid = self._ranked(client)[0]["ranking_id"]
+        resp = client.post("/feedback/bulk", json={"items": [
+            {"ranking_id": rid, "decision": "accept", "notes": "strong"},
+            {"ranking_id": 99999, "decision": "reject"},
+        ]})
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["recorded"] == 1
+        assert [r["status"] for r in data["results"]] == ["ok", "error"]
+        stored = client.get(f"/feedback/job/{data['results'][0]['job_id']}").json()
+        assert stored["total"] == 1
+
+    def test_feedback_survives_weight_adjustment_failure(self, client, test_db):
+        rid = self._ranked(client)[0]["ranking_id"]
+        with patch("app.api.routers.feedback.maybe_trigger_weight_adjustment",
+                   side_effect=RuntimeError("adjustment failed")):
+            with pytest.raises(RuntimeError):
+                client.post("/feedback/", json={"ranking_id": rid, "decision": "accept"})
+        test_db.rollback()  # drop anything the failed request left uncommitted
+        assert test_db.execute("SELECT COUNT(*) FROM feedback").fetchone()[0] == 1
+
+    def test_bulk_feedback_rejects_empty(self, client):
+        resp = client.post("/feedback/bulk", json={"items": []})
+        assert resp.status_code == 422
@@ -0,0 +1,18 @@
+"""
+tests/test_bias_service.py — Tests for bias signal generation.
+"""
+
+from app.services.bias_service import _identify_bias_signals  # type: ignore
+
+
+class TestBiasSignals:
+    def test_affected_names_joined(self):
+        affected = [{"id": 1, "name": "Priya Sharma"}, {"id": 2, "name": "Arjun Mehta"}]
+        signals = _identify_bias_signals(0.8, 0.0, [], affected)
+        assert signals[0]["signal_type"] == "experience_skew"
+        assert signals[0]["affected_names"] == "Priya Sharma, Arjun Mehta"
+
+    def test_affected_names_empty_without_candidates(self):
+        signals = _identify_bias_signals(0.0, 0.8, [], [])
+        assert signals[0]["signal_type"] == "keyword_overfit"
+        assert signals[0]["affected_names"] == ""
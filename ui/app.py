@@ -4,9 +4,17 @@
 
 # pyre-ignore[21]
 import streamlit as st  # type: ignore
-import json
-import plotly.graph_objects as go  # type: ignore
+import streamlit.components.v1 as components  # type: ignore
+import hashlib
+import html
 import requests  # type: ignore
+import time
+from concurrent.futures import ThreadPoolExecutor
+try:
+    # orjson decodes the large ranking/bias payloads several times faster
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:
+    from json import loads as _json_loads
 
 st.set_page_config(page_title="TalentPoint AI", page_icon="🎯", layout="wide")
 
@@ -15,31 +23,27 @@ try:
     from design_system import (  # type: ignore
         inject_custom_css, BG, SURFACE, BORDER, BLUE, BLUE_DK, BLUE_LT, BLUE_BD,
         GREEN, GREEN_LT, GREEN_BD, AMBER, AMBER_LT, AMBER_BD, RED, RED_LT, RED_BD,
-        T1, T2, T3, T4
+        T1, T2, T3, T4,
+        pbar, factor_bar, chips_html, badge, sidebar_pills
     )
 except ImportError:
     from ui.design_system import (  # type: ignore
         inject_custom_css, BG, SURFACE, BORDER, BLUE, BLUE_DK, BLUE_LT, BLUE_BD,
         GREEN, GREEN_LT, GREEN_BD, AMBER, AMBER_LT, AMBER_BD, RED, RED_LT, RED_BD,
-        T1, T2, T3, T4
+        T1, T2, T3, T4,
+        pbar, factor_bar, chips_html, badge, sidebar_pills
     )
 
+# Score bands, indexed branch-free by (s >= .45) + (s >= .70): colour triple and star label
+SCORE_BUCKETS = (((RED, RED_LT, RED_BD), "⭐"),
+                 ((AMBER, AMBER_LT, AMBER_BD), "⭐⭐⭐"),
+                 ((GREEN, GREEN_LT, GREEN_BD), "⭐⭐⭐⭐⭐"))
+
+def sband(s):
+    return (s >= .45) + (s >= .70)
+
 def scolor(s):
-    if s >= .70: return GREEN, GREEN_LT, GREEN_BD
-    if s >= .45: return AMBER, AMBER_LT, AMBER_BD
-    return RED, RED_LT, RED_BD
-
-def slabel(s):
-    if s >= .70: return "⭐⭐⭐⭐⭐"
-    if s >= .45: return "⭐⭐⭐"
-    return "⭐"
-
-@st.cache_data(ttl=10, show_spinner=False)
-def fetch_stats():
-    """Cached fetch of basic counts to speed up sidebar reruns."""
-    rd, _ = api("get", "/resumes/")
-    jd_s, _ = api("get", "/jobs/")
-    return (rd["total"] if rd else 0), (jd_s["total"] if jd_s else 0)
+    return SCORE_BUCKETS[sband(s)][0]
 
 @st.cache_data(ttl=15, show_spinner=False)
 def check_health():
@@ -56,10 +60,125 @@ def fetch_jobs():
     return res.get("jobs", []) if res else [], err
 
 @st.cache_data(ttl=30, show_spinner=False)
-def fetch_ranking_results(job_id):
-    """Cached ranking results."""
+def fetch_resumes():
+    """Cached stored-resumes list."""
+    res, _ = api("get", "/resumes/")
+    return res.get("resumes", []) if isinstance(res, dict) else []
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _jopts(jobs_tuple):
+    """Cached job selector options, keyed on ((title, id), ...)."""
+    return {f"{t}  (ID: {i})": i for t, i in jobs_tuple}
+
+def job_options(jobs):
+    return _jopts(tuple((j["title"], j["id"]) for j in jobs))
+
+def job_select(jopts):
+    """Job selectbox shared by the pages. Widget state is dropped on pages that do not
+    render it (Input), so the chosen id is also kept in plain session state and used
+    to re-seed the widget."""
+    if st.session_state.get("job_sel") not in jopts:
+        remembered = next((lbl for lbl, i in jopts.items() if i == st.session_state.get("job_id")), next(iter(jopts)))
+        st.session_state["job_sel"] = remembered
+    sel = st.selectbox("Job", list(jopts), key="job_sel", label_visibility="collapsed")
+    st.session_state["job_id"] = jopts[sel]
+    return sel
+
+# Ranking and bias payloads live in the LRU-bounded data cache rather than in
+# session_state, which is never evicted while a tab stays open
+def _annotate(res):
+    # Display values are derived once per fetch instead of per row on every rerun;
+    # "_bands" counts candidates per score band (weak, moderate, strong)
+    if not res: return res
+    bands = [0, 0, 0]
+    for c in res.get("ranked_candidates", []):
+        tot = c["total_score"]
+        band = sband(tot)
+        bands[band] += 1
+        c["_pct"] = int(tot*100)
+        c["_color"], c["_label"] = SCORE_BUCKETS[band]
+    res["_bands"] = tuple(bands)
+    return res
+
+class _FetchFailed(Exception):
+    """Raised inside a cached fetcher so st.cache_data keeps no entry for the failure."""
+
+# Results are shared by every session, so only successful fetches are cached; a
+# "no rankings yet" 404 is retried on the next rerun instead of sticking for the TTL.
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def _ranking_results(job_id, nonce):
     res, err = api("get", f"/rank/{job_id}/results")
-    return res, err
+    if err or not res: raise _FetchFailed(err)
+    return _annotate(res)
+
+def fetch_ranking_results(job_id, nonce=0):
+    """Cached ranking results. `nonce` is bumped by Run Scoring to force a refetch."""
+    try:
+        return _ranking_results(job_id, nonce), None
+    except _FetchFailed as e:
+        return None, e.args[0]
+
+@st.cache_data(ttl=30, max_entries=64, show_spinner=False)
+def _feedback_view(job_id, nonce):
+    res, err = api("get", f"/rank/{job_id}/results?include=feedback_stats")
+    if err or not res: raise _FetchFailed(err)
+    return _annotate(res)
+
+def fetch_feedback_view(job_id, nonce=0):
+    """Cached ranking results with the job's feedback stats embedded — one request for the Feedback page."""
+    try:
+        return _feedback_view(job_id, nonce), None
+    except _FetchFailed as e:
+        return None, e.args[0]
+
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def _bias_report(job_id, version, nonce):
+    rep, err = api("get", f"/bias/{job_id}")
+    if err or not rep: raise _FetchFailed(err)
+    return rep
+
+def fetch_bias_report(job_id, version, nonce=0):
+    """Cached bias report, keyed on the ranking run it was computed from.
+    `nonce` is bumped by Run Fairness Analysis to recompute for this session only."""
+    try:
+        return _bias_report(job_id, version, nonce), None
+    except _FetchFailed as e:
+        return None, e.args[0]
+
+def rank_nonce(job_id):
+    return st.session_state.get(f"rank_nonce_{job_id}", 0)
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_job_feedback(job_id):
+    """Cached feedback entries for a job (newest first)."""
+    fb_res, _ = api("get", f"/feedback/job/{job_id}")
+    return fb_res
+
+FACTOR_COLORS = (BLUE, GREEN, AMBER)
+
+# The spec is a plain Vega-Lite dict: st.vega_lite_chart ships it as-is, whereas an
+# Altair chart is re-validated and re-serialized through to_dict() on every rerun
+@st.cache_data(max_entries=32, show_spinner=False)
+def factor_chart_spec(fd_key):
+    """Cached Factor Contribution bars in the design palette, keyed on ((factor_name, contribution), ...)."""
+    names = [name.replace("_"," ").title() for name, _ in fd_key]
+    x = {"field": "Factor", "type": "nominal", "sort": None, "title": None, "axis": {"labelAngle": 0}}
+    y = {"field": "Contribution", "type": "quantitative", "title": None, "axis": {"format": ".0%"}}
+    return {
+        "height": 220,
+        "data": {"values": [{"Factor": n, "Contribution": v} for n, (_, v) in zip(names, fd_key)]},
+        "layer": [
+            {"mark": {"type": "bar", "cornerRadiusTopLeft": 4, "cornerRadiusTopRight": 4},
+             "encoding": {"x": x, "y": y,
+                          "color": {"field": "Factor", "type": "nominal", "legend": None,
+                                    "scale": {"domain": names,
+                                              "range": [FACTOR_COLORS[i % len(FACTOR_COLORS)] for i in range(len(names))]}},
+                          "tooltip": [{"field": "Factor", "type": "nominal"},
+                                      {"field": "Contribution", "type": "quantitative", "format": ".1%"}]}},
+            {"mark": {"type": "text", "dy": -6, "fontWeight": 700, "color": T2},
+             "encoding": {"x": x, "y": y, "text": {"field": "Contribution", "type": "quantitative", "format": ".0%"}}},
+        ],
+    }
 
 # Lock in the Design System
 inject_custom_css()
@@ -70,79 +189,388 @@ API_BASE = os.getenv("API_BASE_URL", "http://127.0.0.1:8000")
 
 # Optimized session for Hugging Face Spaces:
 # Reusing a connection and bypassing environment proxies eliminates the 5s network/proxy delay.
-_api_session = requests.Session()
-_api_session.trust_env = False
+# Held in cache_resource so the keep-alive pool outlives reruns and is shared by
+# every browser session; a module-level Session was rebuilt on each rerun.
+@st.cache_resource(show_spinner=False)
+def _make_api_session():
+    from requests.adapters import HTTPAdapter  # type: ignore
+    from urllib3.util.retry import Retry  # type: ignore
+    sess = requests.Session()
+    sess.trust_env = False
+    # Connect errors retry briefly; reads never do, so a slow POST is not resent
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                          max_retries=Retry(total=2, connect=2, read=0, backoff_factor=0.1))
+    sess.mount("http://", adapter)
+    sess.mount("https://", adapter)
+    return sess
+
+_api_session = _make_api_session()
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
+# Circuit breaker: after a connection failure, calls fail fast for a few seconds
+# instead of each waiting on its own connect attempt
+_API_DOWN_SECS = 5
+
+@st.cache_resource(show_spinner=False)
+def _api_breaker():
+    """Process-wide breaker state (module globals are reset on every rerun)."""
+    return {"until": 0.0}
+
+API_DOWN_MSG = "Cannot connect to API — check if server is running."
+
 def api(method, path, **kw):
+    breaker = _api_breaker()
+    if time.time() < breaker["until"]:
+        return None, API_DOWN_MSG
     try:
-        r = getattr(_api_session, method)(f"{API_BASE}{path}", timeout=60, **kw)
-        if r.status_code == 204 or not r.content:
-            return ({}, None) if r.status_code < 300 else (None, f"HTTP {r.status_code}")
-        try:
-            if not r.content: return ({}, None)
-            data = r.json()
-            if r.status_code < 300: return data, None
-            return None, data.get("detail", f"Error {r.status_code}: {r.text[:200]}")
-        except:
-            msg = f"Error {r.status_code}"
-            if r.text: msg += f": {r.text[:200]}"
-            return None, msg
+        r = _api_session.request(method.upper(), f"{API_BASE}{path}", timeout=60, **kw)
     except requests.exceptions.ConnectionError:
-        return None, "Cannot connect to API — check if server is running."
-    except Exception as e:
-        return None, f"Request error: {str(e)}"
+        breaker["until"] = time.time() + _API_DOWN_SECS
+        return None, API_DOWN_MSG
+    except requests.exceptions.RequestException as e:
+        return None, f"Request error: {e}"
+    if not r.content:  # 204 and other empty bodies
+        return ({}, None) if r.ok else (None, f"HTTP {r.status_code}")
+    # Body is decoded once; error bodies that are not JSON fall back to their text
+    try:
+        data = _json_loads(r.content)
+    except ValueError:
+        return None, f"Error {r.status_code}: {r.text[:200]}"
+    if r.ok:
+        return data, None
+    detail = data.get("detail") if isinstance(data, dict) else None
+    return None, detail or f"Error {r.status_code}: {r.text[:200]}"
+
+@st.cache_data(ttl=300, max_entries=16, show_spinner=False)
+def _pdf_bytes(path, nonce):
+    try:
+        r = _api_session.get(f"{API_BASE}{path}", timeout=30)
+    except requests.exceptions.RequestException as e:
+        raise _FetchFailed(str(e))
+    if r.status_code != 200: raise _FetchFailed(f"HTTP {r.status_code}")
+    return r.content
+
+def fetch_pdf(path, nonce=0):
+    """PDF bytes, or None on failure; a prepared file stays one click away across reruns
+    while a failure is not cached, so the next click retries."""
+    try:
+        return _pdf_bytes(path, nonce)
+    except _FetchFailed:
+        return None
 
 
-def sec(txt):
-    st.markdown(f'<div style="font-size:.7rem;font-weight:700;color:{T3};text-transform:uppercase;letter-spacing:.09em;padding-bottom:.5rem;border-bottom:1px solid {BORDER};margin:1.4rem 0 .85rem;">{txt}</div>', unsafe_allow_html=True)
+# ── Background ranking ────────────────────────────────────────────────────────
+# Run Scoring posts on a worker thread so the script run is not held under a
+# spinner; a polling fragment picks up the result and triggers one full rerun.
+@st.cache_resource(show_spinner=False)
+def _rank_pool():
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="rank")
 
-def pg(title, sub=""):
-    st.markdown(f'<div style="margin-bottom:1.5rem;padding-bottom:1rem;border-bottom:1px solid {BORDER};"><h1 style="font-size:1.5rem;font-weight:800;color:{T1};letter-spacing:-.02em;margin-bottom:3px;">{title}</h1><p style="font-size:.8125rem;color:{T3};">{sub}</p></div>', unsafe_allow_html=True)
+def _post_rank(url):
+    """Runs on the pool; uses the session directly since Streamlit calls need the script thread."""
+    try:
+        r = _api_session.post(url, timeout=300)
+    except requests.exceptions.ConnectionError:
+        return API_DOWN_MSG
+    except requests.exceptions.Timeout:
+        return "Scoring did not finish within 5 minutes. Try again shortly."
+    except requests.exceptions.RequestException as e:
+        return f"Request error: {e}"
+    if r.ok:
+        return None
+    try:
+        return _json_loads(r.content).get("detail") or f"HTTP {r.status_code}"
+    except (ValueError, AttributeError):
+        return f"HTTP {r.status_code}"
+
+def rank_pending():
+    return [k for k in st.session_state.keys() if k.startswith("rank_job_")]
+
+# Mounted in the sidebar while any run is pending, so a run completes into every
+# page rather than only when the user is on Results
+@st.fragment(run_every=1)
+def rank_progress():
+    done = [k for k in rank_pending() if st.session_state[k].done()]
+    if not done:
+        st.info("Computing scores… previous results stay available meanwhile.")
+        return
+    for key in done:
+        err = st.session_state.pop(key).result()
+        if err: st.session_state["rank_err"] = err
+        else: st.session_state[key.replace("rank_job_", "rank_nonce_")] = time.time()
+    # The caches are shared across sessions; the nonce only refreshes this one
+    _ranking_results.clear(); _feedback_view.clear(); ranking_markup.clear()
+    st.rerun()
+
+# Section/page/card markup with the palette substituted once at import; each
+# call only fills its own fields.
+SEC_TPL = f'<div style="font-size:.7rem;font-weight:700;color:{T3};text-transform:uppercase;letter-spacing:.09em;padding-bottom:.5rem;border-bottom:1px solid {BORDER};margin:1.4rem 0 .85rem;">{{txt}}</div>'.format
+PG_TPL = f'<div style="margin-bottom:1.5rem;padding-bottom:1rem;border-bottom:1px solid {BORDER};"><h1 style="font-size:1.5rem;font-weight:800;color:{T1};letter-spacing:-.02em;margin-bottom:3px;">{{title}}</h1><p style="font-size:.8125rem;color:{T3};">{{sub}}</p></div>'.format
+STAT_BOX_TPL = f'<div style="background:{SURFACE};border:1px solid {BORDER};border-top:3px solid {{c}};border-radius:8px;padding:.9rem 1.1rem;text-align:center;box-shadow:0 1px 8px rgba(0,0,0,.06);"><div class="stat-val" style="font-size:1.6rem;font-weight:800;color:{{c}};line-height:1;">{{val}}</div><div class="stat-lbl" style="font-size:.68rem;font-weight:600;color:{T3};text-transform:uppercase;letter-spacing:.08em;margin-top:5px;">{{lbl}}</div></div>'.format
+INFO_CARD_TPL = f'<div style="background:{SURFACE};border:1px solid {BORDER};border-radius:8px;padding:1.25rem 1.5rem;box-shadow:0 1px 8px rgba(0,0,0,.06);">{{content}}</div>'.format
+RESUME_META_TPL = f'<div style="font-size:.8rem;color:{T3};margin-bottom:10px;"><b style="color:{T2};">File:</b> {{file}}<br><b style="color:{T2};">Added:</b> {{added}}</div>'.format
+JOB_META_TPL = f'<div style="font-size:.8rem;color:{T3};margin-bottom:10px;"><b style="color:{T2};">Added:</b> {{added}}<br><b style="color:{T2};">Exp. Required:</b> {{years}} yrs</div>'.format
 
-def stat_box(val, lbl, c=BLUE):
-    st.markdown(f'<div style="background:{SURFACE};border:1px solid {BORDER};border-top:3px solid {c};border-radius:8px;padding:.9rem 1.1rem;text-align:center;box-shadow:0 1px 8px rgba(0,0,0,.06);"><div class="stat-val" style="font-size:1.6rem;font-weight:800;color:{c};line-height:1;">{val}</div><div class="stat-lbl" style="font-size:.68rem;font-weight:600;color:{T3};text-transform:uppercase;letter-spacing:.08em;margin-top:5px;">{lbl}</div></div>', unsafe_allow_html=True)
+def sec(txt):
+    st.markdown(SEC_TPL(txt=txt), unsafe_allow_html=True)
 
-def pbar(pct, col):
-    """Clean, single-line progress bar to prevent Streamlit rendering bugs."""
-    return f'<div style="background:{BORDER};border-radius:99px;height:4px;overflow:hidden;margin-top:6px;width:100%;border:0.5px solid {BORDER};"><div style="background:{col};width:{pct}%;height:100%;border-radius:99px;"></div></div>'
+def pg(title, sub=""):
+    st.markdown(PG_TPL(title=title, sub=sub), unsafe_allow_html=True)
 
-def skill_chip(s, fg, bg, bd):
-    return f'<span style="background:{bg};color:{fg};border:1px solid {bd};font-size:.72rem;font-weight:500;padding:2px 9px;border-radius:20px;display:inline-block;margin:2px;">{s}</span>'
+def stat_row(specs):
+    """One markdown grid for a row of stat boxes; specs are (value, label, colour)."""
+    boxes = "".join(STAT_BOX_TPL(val=v, lbl=lbl, c=c) for v, lbl, c in specs)
+    st.html(f'<div class="tp-stat-row">{boxes}</div>')
 
-def badge(lbl, fg, bg, bd):
-    """Modern status badge with soft tones and precise typography."""
-    return f'<span style="background:{bg}; color:{fg}; border:1px solid {bd}; font-size:0.65rem; font-weight:700; padding:4px 12px; border-radius:100px; text-transform:uppercase; letter-spacing:0.04em; box-shadow: 0 1px 2px rgba(0,0,0,0.04); white-space:nowrap;">{lbl}</span>'
+def factor_rows(bdd, factors, total=0):
+    """Joined sub-score rows for a score breakdown; a "total" factor falls back to the overall score."""
+    vals = ((label, bdd.get(k, total) if k == "total" else bdd.get(k, 0)) for k, label in factors)
+    return "".join(factor_bar(label, int(v*100), scolor(v)[0]) for label, v in vals)
 
 def info_card(content):
-    st.markdown(f'<div style="background:{SURFACE};border:1px solid {BORDER};border-radius:8px;padding:1.25rem 1.5rem;box-shadow:0 1px 8px rgba(0,0,0,.06);">{content}</div>', unsafe_allow_html=True)
-
+    st.markdown(INFO_CARD_TPL(content=content), unsafe_allow_html=True)
+
+
+# Lookup tables used inside page loops; module constants, not per-rerun literals
+UPLOAD_MIME = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".doc": "application/msword",
+    ".txt": "text/plain",
+}
+DETAIL_FACTORS = (("skill_match", "Skill Match"), ("experience_alignment", "Experience"), ("role_relevance", "Role Fit"))
+INSIGHT_FACTORS = (("total", "Overall Alignment"), ("skill_match", "Technical Fit"),
+                   ("experience_alignment", "Experience Fit"), ("role_relevance", "Mission Fit"))
+DECISIONS = ("Progress", "Decline")
+
+# Constant chrome (sidebar header and rules, health pills, empty states) is built
+# once at import rather than re-formatted on every rerun
+SIDEBAR_HEAD = f'<div style="padding:0.5rem 1rem 1rem;border-bottom:1px solid {BORDER};margin-bottom:.75rem;"><div style="font-size:1.0625rem;font-weight:800;color:{T1};letter-spacing:-.02em;">TalentPoint AI</div><div style="font-size:.72rem;color:{T4};margin-top:3px;font-weight:500;">v3.1.2 · Optimized Model</div></div>'
+SIDEBAR_RULE = f'<div style="margin:1rem 0;border-top:1px solid {BORDER};"></div>'
+SIDEBAR_RULE_SM = f'<div style="margin:.75rem 0;border-top:1px solid {BORDER};"></div>'
+HEALTH_PILL_TPL = ('<div style="display:flex;align-items:center;gap:8px;padding:8px 14px;background:{bg};border:1px solid {bd};border-radius:8px;">'
+                   '<div style="width:7px;height:7px;background:{fg};border-radius:50%;flex-shrink:0;"></div>'
+                   '<span style="font-size:.8rem;font-weight:600;color:{fg};">{txt}</span></div>').format
+# Keyed on (api_online, model_ready)
+HEALTH_PILLS = {
+    (True, True):   HEALTH_PILL_TPL(fg=GREEN, bg=GREEN_LT, bd=GREEN_BD, txt="API Connected"),
+    (True, False):  HEALTH_PILL_TPL(fg=AMBER, bg=AMBER_LT, bd=AMBER_BD, txt="Model Loading…"),
+    (False, False): HEALTH_PILL_TPL(fg=RED, bg=RED_LT, bd=RED_BD, txt="API Offline"),
+}
+EMPTY_RESULTS = INFO_CARD_TPL(content=f'<div style="text-align:center;padding:2.5rem 0;font-size:.9rem;color:{T3};">Select a job and click <b style="color:{T1};">Run Scoring</b> to rank candidates.</div>')
+EMPTY_AUDIT = INFO_CARD_TPL(content=f'<div style="text-align:center;padding:2rem 0;font-size:.9rem;color:{T3};">Select a job and click <b style="color:{T1};">Run Fairness Analysis</b>.</div>')
+AUDIT_PASSED = f"""
+<div style="background:{GREEN_LT};border:1px solid {GREEN_BD};border-radius:12px;padding:1.5rem;box-shadow:0 4px 15px rgba(15,123,85,.05);">
+  <div style="display:flex;align-items:center;gap:12px;margin-bottom:1rem;">
+    <div style="background:{GREEN};color:#fff;width:24px;height:24px;border-radius:50%;display:flex;align-items:center;justify-content:center;font-size:.8rem;font-weight:900;">✓</div>
+    <div style="font-size:1rem;font-weight:700;color:{GREEN};">Fairness Verification Passed</div>
+  </div>
+  <p style="font-size:.825rem;color:{T2};line-height:1.6;margin-bottom:1rem;">The audit has completed. No statistically significant bias markers were found in this ranking cycle. The score distribution aligns with job-relevant requirements.</p>
+  <div style="display:grid;grid-template-columns:1fr 1fr;gap:10px;">
+    <div style="display:flex;align-items:center;gap:8px;font-size:.78rem;color:{T3};"><span style="color:{GREEN};">●</span> Gender-Neutral Language check</div>
+    <div style="display:flex;align-items:center;gap:8px;font-size:.78rem;color:{T3};"><span style="color:{GREEN};">●</span> Age-Bias Trigger check</div>
+    <div style="display:flex;align-items:center;gap:8px;font-size:.78rem;color:{T3};"><span style="color:{GREEN};">●</span> Keyword Over-Optimization check</div>
+    <div style="display:flex;align-items:center;gap:8px;font-size:.78rem;color:{T3};"><span style="color:{GREEN};">●</span> Geographic Proxy check</div>
+  </div>
+</div>
+"""
+
+# Review-queue status badges are identical for every candidate
+BADGE_PROG = badge("PROGRESSED", GREEN, GREEN_LT, GREEN_BD)
+BADGE_DECL = badge("DECLINED", RED, RED_LT, RED_BD)
+BADGE_PEND = badge("PENDING", T4, SURFACE, BORDER)
+BADGE_STAGED = badge("STAGED", BLUE, BLUE_LT, BLUE_BD)
+
+# Transcripts longer than this are collapsed to a preview in the Document Explorer
+DOC_PREVIEW_CHARS = 20000
+
+DOC_FRAME = (f'<body style="margin:0;"><div style="font-family:Inter,system-ui,sans-serif;font-size:.8rem;'
+             f'line-height:1.7;color:{T2};padding:1rem;white-space:pre-wrap;">{{body}}</div></body>').format
+
+def split_transcript(txt):
+    """Return (escaped preview, remaining raw text) for a resume transcript."""
+    preview, rest = txt[:DOC_PREVIEW_CHARS], txt[DOC_PREVIEW_CHARS:]
+    return html.escape(preview) + ("…" if rest else ""), rest
+
+def doc_viewer(title, txt, key, muted=False):
+    """Document Explorer: header card as markdown, transcript in a scrolling iframe.
+
+    The transcript bypasses the markdown pipeline entirely; it is plain escaped text.
+    """
+    preview, rest = split_transcript(txt)
+    st.markdown(f'<div class="tp-doc{" muted" if muted else ""}"><div class="tp-doc-head">'
+                f'<span class="tp-doc-title">{title}</span><span class="tp-doc-meta">{len(txt)} chars</span>'
+                f'</div></div>', unsafe_allow_html=True)
+    components.html(DOC_FRAME(body=preview), height=370, scrolling=True)
+    if rest and st.toggle("Show full transcript", key=key):
+        components.html(DOC_FRAME(body=html.escape(rest)), height=370, scrolling=True)
+
+
+# ── Results ranking table (styled by .tp-rank-tbl in the design system) ───────
+RANK_TBL_HEAD = ('<colgroup><col style="width:7%"><col style="width:35%"><col style="width:11%"><col style="width:11%">'
+                 '<col style="width:11%"><col style="width:11%"><col style="width:14%"></colgroup>'
+                 '<tr><th>#</th><th>Candidate</th><th>Overall</th><th>Skillset</th><th>Exp.</th><th>Role Fit</th><th>Status</th></tr>')
+# One template per desktop row / mobile card, filled with format_map.
+# Flat single-line markup avoids Markdown's 4-space indent code-block trigger.
+BOOST_TAG = f'<span title="Talent Boost" style="background:{AMBER_LT}; border:1px solid {AMBER_BD}; color:{AMBER}; font-size:0.6rem; padding:2px 8px; border-radius:4px; margin-left:10px; font-weight:700;">BOOST ⭐</span>'
+RANK_METRIC_TPL = '<td><div class="mv">{v}%</div>{bar}</td>'.format
+RANK_ROW_TPL = ('<tr class="{row_cls}"><td class="rk">#{rank}</td><td class="nm">{name}{boost}</td>'
+                '<td class="sc" style="color:{fg};">{pct}<small>%</small></td>{metrics}<td>{badge}</td></tr>').format_map
+RANK_CARD_TPL = (
+    '<div style="background:{row_bg}; border:1px solid {card_bd}; border-radius:12px; padding:18px; margin-bottom:14px; box-shadow:0 4px 12px rgba(0,0,0,0.06); border-left:4px solid {fg};">'
+    '<div style="display:flex;justify-content:space-between;align-items:flex-start;margin-bottom:14px;"><div style="flex:1;"><div style="display:flex;align-items:center;gap:8px;margin-bottom:4px;">'
+    f'<span style="font-size:0.7rem;font-weight:800;color:{T4};text-transform:uppercase;letter-spacing:0.05em;">Rank #{{rank}}</span>{{boost}}</div>'
+    f'<div style="font-size:1.05rem;font-weight:700;color:{T1};line-height:1.3;">{{name}}</div></div>'
+    '<div style="text-align:right;"><div style="font-size:1.4rem;font-weight:800;color:{fg};line-height:1;">{pct}<small style="font-size:0.7rem;opacity:0.8;">%</small></div>'
+    f'<div style="font-size:0.6rem;color:{T4};text-transform:uppercase;font-weight:700;margin-top:4px;">Match</div></div></div>'
+    f'<div style="display:grid;grid-template-columns:1fr 1fr 1fr;gap:12px;margin-bottom:16px;padding:12px;background:{BG};border-radius:8px;border:1px solid {BORDER};">'
+    + "".join(f'<div><div style="font-size:0.55rem;color:{T3};text-transform:uppercase;font-weight:700;margin-bottom:4px;">{lbl}</div>'
+              f'<div style="font-size:0.85rem;font-weight:800;color:{T1};">{{{key}}}%</div></div>' for lbl, key in (("Skills","sk"),("Exp","ex"),("Role","rf")))
+    + '</div><div style="display:flex;justify-content:space-between;align-items:center;">{badge}'
+    f'<div style="font-size:0.72rem;color:{BLUE};font-weight:600;cursor:pointer;">Tap for details →</div></div></div>'
+).format_map
+
+
+# Built markup is keyed on the ranking run (generated_at) and the picked row, so
+# reruns that only touch other widgets reuse the joined HTML
+@st.cache_data(ttl=600, max_entries=64, show_spinner=False)
+def ranking_markup(job_id, nonce, generated_at, picked):
+    """Cached (desktop table, mobile cards) HTML for a ranking run."""
+    res, _ = fetch_ranking_results(job_id, nonce)
+    cands = (res or {}).get("ranked_candidates", [])
+    rows, cards = [], []
+    for c in cands:
+        rank  = c["rank"]
+        name  = html.escape(c.get("candidate_name","—"))
+        bd    = c.get("score_breakdown",{})
+        sk    = bd.get("skill_match",0)
+        ex    = bd.get("experience_alignment",0)
+        rf    = bd.get("role_relevance",0)
+        pct   = c["_pct"]
+        fg,bg2,bd2 = c["_color"]
+        lbl   = c["_label"]
+        
+        is_picked = (picked == c.get("candidate_name","—"))
+        row = {
+            "rank": rank, "name": name, "pct": pct, "fg": fg,
+            "boost": BOOST_TAG if bd.get("boost_applied") else "",
+            "badge": badge(lbl,fg,bg2,bd2),
+            "sk": int(sk*100), "ex": int(ex*100), "rf": int(rf*100),
+            "row_cls": "picked" if is_picked else "",
+            "row_bg": BLUE_LT if is_picked else SURFACE,
+            "card_bd": BLUE_BD if is_picked else BORDER,
+        }
+        row["metrics"] = "".join(RANK_METRIC_TPL(v=v, bar=pbar(v, fg)) for v in (row["sk"], row["ex"], row["rf"]))
+        rows.append(RANK_ROW_TPL(row))
+        cards.append(RANK_CARD_TPL(row))
+    return (f'<div class="desktop-only"><table class="tp-rank-tbl">{RANK_TBL_HEAD}{"".join(rows)}</table></div>',
+            f'<div class="mobile-only">{"".join(cards)}</div>')
+
+# ── Bias signal cards (styled by .tp-signal classes in the design system) ─────
+SEVERITIES = ("high", "medium", "low")
+SIGNAL_TPL = ('<div class="tp-signal {sev}"><div class="tp-signal-head"><span class="tp-sev">{sev}</span>'
+              '<span class="tp-signal-title">{title}</span></div>'
+              '<div class="tp-signal-desc">{desc}</div>{affected}</div>').format_map
+AFFECTED_TPL = '<div class="tp-affected">Influential Candidates: <span>{names}</span></div>'.format
+
+# Static Fairness Audit guidance, shown collapsed under an expander
+ADVOCACY_HTML = """
+<div class="tp-advocacy">
+  <p>
+    <b>The "YoE Blind Spot":</b> Candidates often forget to explicitly state their total years of experience, or use varied date formats.
+    If a top candidate is ranked lower than expected, check if they have a <b>Skill Match</b> > 0.80. This usually indicates a
+    strong profile despite detected tenure gaps.
+  </p>
+  <p>
+    <b>Talent Boost:</b> The system automatically applies a 40% penalty-dampening boost (⭐) to candidates who show exceptional
+    role relevance and skills, even if their experience count is low. This ensures we don't miss "Fast Track" talent.
+  </p>
+</div>
+"""
+
+
+# ── Feedback review queue ─────────────────────────────────────────────────────
+# A fragment: Stage reruns only the queue and its submit button, not the page
+# fetches and summary above it. Decisions are staged per row and written in
+# one /feedback/bulk request. Row spacing comes from the form's CSS margin
+# rather than a spacer element per row.
+FB_PAGE_SIZE = 20
+FB_ROW_TPL = ('<div class="tp-fb-row"><div class="tp-fb-rank">#{rank}</div><div class="tp-fb-name">{name}</div>'
+              '<div class="tp-fb-score" style="color:{fg};">{pct}%</div>{status} {label}</div>')
+
+@st.fragment
+def review_queue(jid, cands, fb_map):
+    pending = st.session_state.setdefault(f"fb_pending_{jid}", {})
+    if "fb_flash" in st.session_state:
+        st.success(st.session_state.pop("fb_flash"))
+    # Only one page of rows is built; staged decisions persist in `pending` across pages
+    n_pages = max(1, -(-len(cands) // FB_PAGE_SIZE))
+    page_no = 1
+    if n_pages > 1:
+        page_no = st.number_input(f"Page (of {n_pages})", 1, n_pages, key=f"fb_page_{jid}")
+    for c in cands[(page_no-1)*FB_PAGE_SIZE : page_no*FB_PAGE_SIZE]:
+        rid=c.get("ranking_id")
+        if not rid: continue
+        name=c.get("candidate_name","—"); rank=c["rank"]
+        fg,bg2,bd2=c["_color"]
+        prev = pending[rid]["decision"] if rid in pending else fb_map.get(rid)
+        # Form: radio/notes edits stay client-side until Stage triggers the rerun
+        with st.form(f"f_{rid}", clear_on_submit=False, border=False):
+            row_slot = st.empty()
+            # Plain vertical stack — no per-row column containers
+            dec=st.radio("",DECISIONS,index=1 if prev == "reject" else 0,key=f"d_{rid}",horizontal=True,label_visibility="collapsed")
+            notes=st.text_input("",pending[rid]["notes"] if rid in pending else "",key=f"n_{rid}",placeholder="Optional notes…",label_visibility="collapsed")
+            staged=st.form_submit_button("Stage")
+        cur=(dec,notes)
+        if staged and st.session_state.get(f"last_{rid}")==cur:
+            pending.pop(rid, None)
+            st.toast("No change")  # same decision as last submitted — nothing to write
+        elif staged:
+            pending[rid]={"ranking_id":rid,"decision":"accept" if dec=="Progress" else "reject","notes":notes,"name":name,"cur":cur}
+
+        status_badge = " " + (BADGE_STAGED if rid in pending else BADGE_PROG if prev == "accept" else BADGE_DECL if prev == "reject" else BADGE_PEND)
+        row_slot.html(FB_ROW_TPL.format_map({"rank": rank, "name": html.escape(name), "fg": fg, "pct": c["_pct"],
+                                             "status": status_badge, "label": badge(c["_label"],fg,bg2,bd2)}))
+
+    if st.button(f"Submit reviewed ({len(pending)})", disabled=not pending, key="fb_submit_all"):
+        items=[{k: p[k] for k in ("ranking_id","decision","notes")} for p in pending.values()]
+        resp,ferr=api("post","/feedback/bulk",json={"items":items})
+        if resp:
+            for r in resp["results"]:
+                p=pending.pop(r["ranking_id"]) if r["status"]=="ok" else pending[r["ranking_id"]]
+                if r["status"]=="ok": st.session_state[f"last_{r['ranking_id']}"]=p["cur"]
+                else: st.error(f"{p['name']}: {r['detail']}")
+            _feedback_view.clear(); fetch_job_feedback.clear()
+            if resp["recorded"]:
+                msg=f"{resp['recorded']} decision(s) recorded"
+                if resp.get("weight_adjustment_triggered"): msg+=" — weights updated"
+                st.session_state["fb_flash"]=msg
+                if not pending: st.rerun()  # refresh stats and badges; errors stay on screen otherwise
+        else: st.error(ferr)
 
 # ── Sidebar ───────────────────────────────────────────────────────────────────
 with st.sidebar:
-    st.markdown(f'<div style="padding:0.5rem 1rem 1rem;border-bottom:1px solid {BORDER};margin-bottom:.75rem;"><div style="font-size:1.0625rem;font-weight:800;color:{T1};letter-spacing:-.02em;">TalentPoint AI</div><div style="font-size:.72rem;color:{T4};margin-top:3px;font-weight:500;">v3.1.2 · Optimized Model</div></div>', unsafe_allow_html=True)
+    st.markdown(SIDEBAR_HEAD, unsafe_allow_html=True)
 
     page = st.radio("nav", ["Input","Results","Explanations","Fairness Audit","Feedback"], label_visibility="collapsed")
 
-    st.markdown(f'<div style="margin:1rem 0;border-top:1px solid {BORDER};"></div>', unsafe_allow_html=True)
+    st.markdown(SIDEBAR_RULE, unsafe_allow_html=True)
 
     is_online, model_ready = check_health()
-    if is_online and model_ready:
-        st.markdown(f'<div style="display:flex;align-items:center;gap:8px;padding:8px 14px;background:{GREEN_LT};border:1px solid {GREEN_BD};border-radius:8px;"><div style="width:7px;height:7px;background:{GREEN};border-radius:50%;flex-shrink:0;"></div><span style="font-size:.8rem;font-weight:600;color:{GREEN};">API Connected</span></div>', unsafe_allow_html=True)
-    elif is_online and not model_ready:
-        st.markdown(f'<div style="display:flex;align-items:center;gap:8px;padding:8px 14px;background:{AMBER_LT};border:1px solid {AMBER_BD};border-radius:8px;"><div style="width:7px;height:7px;background:{AMBER};border-radius:50%;flex-shrink:0;"></div><span style="font-size:.8rem;font-weight:600;color:{AMBER};">Model Loading…</span></div>', unsafe_allow_html=True)
-    else:
-        st.markdown(f'<div style="display:flex;align-items:center;gap:8px;padding:8px 14px;background:{RED_LT};border:1px solid {RED_BD};border-radius:8px;"><div style="width:7px;height:7px;background:{RED};border-radius:50%;flex-shrink:0;"></div><span style="font-size:.8rem;font-weight:600;color:{RED};">API Offline</span></div>', unsafe_allow_html=True)
+    st.markdown(HEALTH_PILLS[(is_online, model_ready) if is_online else (False, False)], unsafe_allow_html=True)
 
-    st.markdown(f'<div style="margin:.75rem 0;border-top:1px solid {BORDER};"></div>', unsafe_allow_html=True)
+    st.markdown(SIDEBAR_RULE_SM, unsafe_allow_html=True)
 
-    nr, nj = fetch_stats()
+    # Counts come from the same cached lists the pages use — no extra GETs
+    nr, nj = len(fetch_resumes()), len(fetch_jobs()[0])
 
     # Two stat pills — inline, no transforms/absolute positioning
-    st.markdown(f'<div style="display:grid;grid-template-columns:1fr 1fr;gap:8px;margin-bottom:.75rem;"><div style="background:{BLUE_LT};border:1px solid {BLUE_BD};border-radius:8px;padding:12px;text-align:center;"><div style="font-size:1.4rem;font-weight:800;color:{BLUE};">{nr}</div><div style="font-size:.65rem;color:{T3};text-transform:uppercase;letter-spacing:.07em;margin-top:3px;">Resumes</div></div><div style="background:{BLUE_LT};border:1px solid {BLUE_BD};border-radius:8px;padding:12px;text-align:center;"><div style="font-size:1.4rem;font-weight:800;color:{BLUE};">{nj}</div><div style="font-size:.65rem;color:{T3};text-transform:uppercase;letter-spacing:.07em;margin-top:3px;">Jobs</div></div></div><div style="font-size:.7rem;color:{T4};line-height:1.6;padding:0 2px;border-top:1px solid {BORDER};padding-top:.75rem;">Final decisions rest with the recruiter. Scores are assistive only.</div>', unsafe_allow_html=True)
+    st.markdown(sidebar_pills(nr, nj), unsafe_allow_html=True)
+    # Only mounted while a run is pending, so nothing polls once it completes
+    if rank_pending(): rank_progress()
     
-    st.markdown(f'<div style="margin:1rem 0;border-top:1px solid {BORDER};"></div>', unsafe_allow_html=True)
+    st.markdown(SIDEBAR_RULE, unsafe_allow_html=True)
 
     with st.expander("📖 Step-by-Step Guide", expanded=False):
         st.markdown(f"""
@@ -173,78 +601,70 @@ if page == "Input":
 
         uploaded = st.file_uploader("Drop files here", type=["pdf","docx","doc","txt"],
                         accept_multiple_files=True, label_visibility="collapsed")
-        ok: int = 0
-        fail: int = 0
         if uploaded:
             if st.button("Upload Resumes", use_container_width=True):
-                prog = st.progress(0); status = st.empty()
-                for i, f in enumerate(uploaded):
-                    status.caption(f"Processing {f.name}…")
-                    # Derive MIME from extension first — Streamlit's f.type is unreliable across browsers
-                    _ext_mime = {
-                        ".pdf": "application/pdf",
-                        ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                        ".doc": "application/msword",
-                        ".txt": "text/plain",
-                    }
-                    import pathlib as _pl
-                    _ext = _pl.Path(f.name).suffix.lower()
-                    _mime = _ext_mime.get(_ext) or f.type or "application/octet-stream"
-                    d, e = api("post", "/resumes/upload",
-                        files={"file": (f.name, f.getvalue(), _mime)})
-                    if d: ok = ok + 1   # type: ignore
-                    else:
-                        fail = fail + 1  # type: ignore
-                        st.warning(f"{f.name}: {e}")
-                    prog.progress((i+1)/len(uploaded))
-                status.empty()
-                if ok: st.success(f"{ok} resume(s) uploaded.")
-                if fail: st.error(f"{fail} failed.")
+                # Derive MIME from extension first — Streamlit's f.type is unreliable across browsers.
+                # The UploadedFile objects are passed as-is: requests reads each one while encoding
+                # the body, instead of getvalue() holding a second copy of every file up front
+                for f in uploaded: f.seek(0)
+                files = [("files", (f.name, f, UPLOAD_MIME.get(os.path.splitext(f.name)[1].lower()) or f.type or "application/octet-stream"))
+                         for f in uploaded]
+                # One multipart request for the whole batch instead of a POST per file
+                with st.spinner(f"Processing {len(files)} file(s)…"):
+                    d, e = api("post", "/resumes/upload-batch", files=files)
+                if e:
+                    st.cache_data.clear()  # files before the failing one may already be stored
+                    st.error(e)
+                else:
+                    for fl in d["failed"]: st.warning(f"{fl['file_name']}: {fl['detail']}")
+                    if d["uploaded"]:
+                        st.cache_data.clear()  # refresh resume lists and sidebar counts
+                        st.success(f"{len(d['uploaded'])} resume(s) uploaded.")
+                    if d["failed"]: st.error(f"{len(d['failed'])} failed.")
 
         sec("Paste plain-text resume")
         with st.expander("Enter resume manually"):
-            pn = st.text_input("Candidate name", placeholder="Full name")
-            pt = st.text_area("Resume text", placeholder="Paste full resume content here…", height=180)
-            if st.button("Submit Resume", use_container_width=True):
+            # A form defers the rerun (and the sidebar fetches) until submit instead of every edit
+            with st.form("paste_resume", border=False):
+                pn = st.text_input("Candidate name", placeholder="Full name")
+                pt = st.text_area("Resume text", placeholder="Paste full resume content here…", height=180)
+                submitted = st.form_submit_button("Submit Resume", use_container_width=True)
+            if submitted:
                 if pn and pt:
                     d, e = api("post", "/resumes/upload-text", data={"name": pn, "raw_text": pt})
-                    if d: st.success(f"{d['candidate_name']} — {d['skills_extracted']} skills · {d['total_years_experience']:.1f} yrs")
+                    if d:
+                        st.cache_data.clear()
+                        st.success(f"{d['candidate_name']} — {d['skills_extracted']} skills · {d['total_years_experience']:.1f} yrs")
                     else: st.error(e)
                 else: st.warning("Name and text required.")
 
         sec("Stored Resumes")
-        rl, _ = api("get", "/resumes/")
-        resumes_list = rl.get("resumes", []) if isinstance(rl, dict) else []
-        if isinstance(resumes_list, list):
+        resumes_list = fetch_resumes()
+        if resumes_list:
             for r in resumes_list:
                 with st.expander(r["name"]):
-                    st.markdown(f'<div style="font-size:.8rem;color:{T3};margin-bottom:10px;"><b style="color:{T2};">File:</b> {r["file_name"]}<br><b style="color:{T2};">Added:</b> {r["created_at"][:16].replace("T"," ")}</div>', unsafe_allow_html=True)
+                    st.markdown(RESUME_META_TPL(file=html.escape(r["file_name"]), added=r["created_at"][:16].replace("T"," ")), unsafe_allow_html=True)
                     b1, b2 = st.columns(2)
                     with b1:
                         show_text = st.toggle("View Text", key=f"vtog_{r['id']}")
                     with b2:
-                        if st.button("Download PDF", key=f"d_{r['id']}", use_container_width=True):  # type: ignore
+                        # Once generated, the bytes are cached and Save PDF stays rendered across reruns
+                        if st.session_state.get(f"pdf_{r['id']}") or st.button("Download PDF", key=f"d_{r['id']}", use_container_width=True):  # type: ignore
                             with st.spinner("Generating…"):
-                                pr = _api_session.get(f"{API_BASE}/resumes/{r['id']}/pdf", timeout=30)
-                            if pr.status_code == 200:
-                                st.download_button("Save PDF", pr.content, f"{r['name'].replace(' ','_')}.pdf", "application/pdf", key=f"ds_{r['id']}", use_container_width=True)
+                                pdf = fetch_pdf(f"/resumes/{r['id']}/pdf")
+                            # Only a successful file is kept on screen; a failure brings the button back
+                            st.session_state[f"pdf_{r['id']}"] = bool(pdf)
+                            if pdf:
+                                st.download_button("Save PDF", pdf, f"{r['name'].replace(' ','_')}.pdf", "application/pdf", key=f"ds_{r['id']}", use_container_width=True)
                             else: st.error("PDF failed.")
                     
                     if show_text:
                         det, _ = api("get", f"/resumes/{r['id']}")
                         if det:
                             txt = det.get("raw_text", "")
-                            st.markdown(f"""
-                                <div style="background:{BG}; border: 1px solid {BORDER}; border-radius: 8px; padding: 1.25rem; margin-top: 12px; box-shadow: 0 4px 6px -1px rgba(0,0,0,0.05);">
-                                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 12px; border-bottom: 1px solid {BORDER}; padding-bottom: 8px;">
-                                        <span style="font-size: 0.65rem; font-weight: 800; color: {T3}; text-transform: uppercase; letter-spacing: 0.1em;">Document Explorer</span>
-                                        <span style="font-size: 0.65rem; color: {T4};">{len(txt)} chars</span>
-                                    </div>
-                                    <div style="font-size: 0.82rem; color: {T2}; line-height: 1.7; max-height: 350px; overflow-y: auto; white-space: pre-wrap; font-family: 'Inter', system-ui, sans-serif;">{txt}</div>
-                                </div>
-                            """, unsafe_allow_html=True)
-                    
-                    st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
+                            doc_viewer("Document Explorer", txt, f"vfull_{r['id']}", muted=True)
+
+                    # Spacing above the button comes from its st-key-del_r_* class in the CSS
                     if st.button("Delete Resume", key=f"del_r_{r['id']}", use_container_width=True):
                         d, e = api("delete", f"/resumes/{r['id']}")
                         if e: st.error(e)
@@ -258,12 +678,15 @@ if page == "Input":
     with col_j:
         info_card(f'<div style="font-size:.9375rem;font-weight:700;color:{T1};margin-bottom:2px;">Job Description</div><div style="font-size:.8rem;color:{T3};">Required skills, qualifications, and experience expectations.</div>')
         st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
-        jt = st.text_input("Job title", placeholder="e.g. Senior Software Engineer")
-        jx = st.text_area("Job description", placeholder="Required:\n- Python, FastAPI\n- 5+ years\n\nPreferred:\n- Docker, AWS", height=300)
-        if st.button("Save Job Description", use_container_width=True):
+        with st.form("add_job", border=False):
+            jt = st.text_input("Job title", placeholder="e.g. Senior Software Engineer")
+            jx = st.text_area("Job description", placeholder="Required:\n- Python, FastAPI\n- 5+ years\n\nPreferred:\n- Docker, AWS", height=300)
+            submitted = st.form_submit_button("Save Job Description", use_container_width=True)
+        if submitted:
             if jt and jx and len(jx) >= 50:
                 d, e = api("post", "/jobs/", json={"title": jt, "description": jx})
                 if d:
+                    st.cache_data.clear()
                     req = d.get("required_skills", [])
                     pref = d.get("preferred_skills", [])
                     st.success(f"Saved: {d['title']} (ID {d['job_id']})")
@@ -276,7 +699,7 @@ if page == "Input":
         if jl:
             for j in jl:
                 with st.expander(f"{j['title']} (ID: {j['id']})"):
-                    st.markdown(f'<div style="font-size:.8rem;color:{T3};margin-bottom:10px;"><b style="color:{T2};">Added:</b> {j["created_at"][:16].replace("T"," ")}<br><b style="color:{T2};">Exp. Required:</b> {j["min_years_experience"]} yrs</div>', unsafe_allow_html=True)
+                    st.markdown(JOB_META_TPL(added=j["created_at"][:16].replace("T"," "), years=j["min_years_experience"]), unsafe_allow_html=True)
                     if st.button("Delete Job Role", key=f"del_j_{j['id']}", use_container_width=True):
                         d, e = api("delete", f"/jobs/{j['id']}")
                         if e: st.error(e)
@@ -292,50 +715,44 @@ if page == "Input":
 elif page == "Results":
     pg("Ranked Candidates", "Assistive scoring only — final decisions remain with the recruiter.")
 
-    jobs, err = api("get", "/jobs/")
+    jl, err = fetch_jobs()
     if err: st.error(err); st.stop()
-    if not jobs["jobs"]:  # type: ignore
+    if not jl:
         st.info("No jobs found — add a job description first."); st.stop()
 
-    jopts = {f"{j['title']}  (ID: {j['id']})": j["id"] for j in jobs["jobs"]}  # type: ignore
+    jopts = job_options(jl)
     c1, c2, c3 = st.columns([2,1.2,1])
-    with c1: sel = st.selectbox("Job", list(jopts.keys()), label_visibility="collapsed")
+    with c1: sel = job_select(jopts)
     job_id = jopts[sel]
     with c2: 
         sprio = st.toggle("Skills Priority", help="Dampen experience penalties to prioritize candidate potential and skills.")
         if sprio:
             st.caption("✨ Skills-First mode active. Click 'Run Scoring' to apply boost.")
+    inflight = f"rank_job_{job_id}" in st.session_state
     with c3:
-        if st.button("Run Scoring", use_container_width=True):
+        if st.button("Run Scoring", use_container_width=True, disabled=inflight) and not inflight:
             _, _model_ready = check_health()
             if not _model_ready:
                 st.warning("⏳ AI model is still loading (~30s on cold start). Please wait and try again.")
             else:
-                with st.spinner("Computing scores…"):
-                    d, e = api("post", f"/rank/{job_id}?skills_priority={str(sprio).lower()}")
-                if e: st.error(e); st.stop()
-                st.session_state[f"rank_{job_id}"] = d
-
-    if f"rank_{job_id}" not in st.session_state:
-        sv, _ = api("get", f"/rank/{job_id}/results")
-        if sv: st.session_state[f"rank_{job_id}"] = sv
+                st.session_state[f"rank_job_{job_id}"] = _rank_pool().submit(
+                    _post_rank, f"{API_BASE}/rank/{job_id}?skills_priority={str(sprio).lower()}")
+                st.rerun()  # the sidebar is already drawn; rerun so it mounts the poller
+    if "rank_err" in st.session_state: st.error(st.session_state.pop("rank_err"))
 
-    res = st.session_state.get(f"rank_{job_id}")
+    res, _ = fetch_ranking_results(job_id, rank_nonce(job_id))
     if not res:
-        info_card(f'<div style="text-align:center;padding:2.5rem 0;font-size:.9rem;color:{T3};">Select a job and click <b style="color:{T1};">Run Scoring</b> to rank candidates.</div>')
+        st.markdown(EMPTY_RESULTS, unsafe_allow_html=True)
         st.stop()
 
     cands   = res["ranked_candidates"]
     weights = res.get("weights_used", {})
     top     = cands[0]["total_score"] if cands else 0
-    strong  = sum(1 for c in cands if c["total_score"] >= .70)
+    strong  = res["_bands"][2]
 
     st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
-    m1,m2,m3,m4 = st.columns(4)
-    with m1: stat_box(len(cands), "Candidates Scored")
-    with m2: stat_box(f"{int(top*100)}%", "Highest Score", GREEN)
-    with m3: stat_box(strong, "Strong Matches", BLUE)
-    with m4: stat_box(f"{int(weights.get('skill_match',.4)*100)}%", "Skill Weight")
+    stat_row(((len(cands), "Candidates Scored", BLUE), (f"{int(top*100)}%", "Highest Score", GREEN),
+              (strong, "Strong Matches", BLUE), (f"{int(weights.get('skill_match',.4)*100)}%", "Skill Weight", BLUE)))
 
     st.markdown("<div style='height:16px'></div>", unsafe_allow_html=True)
 
@@ -345,109 +762,51 @@ elif page == "Results":
     with pc1:
         picked = st.selectbox("View candidate details", cand_names, label_visibility="visible")
 
-    sec(f"Ranking — {res.get('job_title','')}")
+    sec(f"Ranking — {html.escape(res.get('job_title',''))}")
 
-    # Table header - High density, professional metadata row
-    h0,h1,h2,h3,h4,h5,h6 = st.columns([.5, 2.5, .8, .8, .8, .8, .9])
-    header_style = f"font-size:0.68rem; font-weight:800; color:{T4}; text-transform:uppercase; letter-spacing:0.12em; padding-bottom:12px; border-bottom:1px solid {BORDER};"
-    h0.markdown(f'<div class="desktop-only" style="{header_style}">#</div>', unsafe_allow_html=True)
-    h1.markdown(f'<div class="desktop-only" style="{header_style}">Candidate</div>', unsafe_allow_html=True)
-    h2.markdown(f'<div class="desktop-only" style="{header_style}">Overall</div>', unsafe_allow_html=True)
-    h3.markdown(f'<div class="desktop-only" style="{header_style}">Skillset</div>', unsafe_allow_html=True)
-    h4.markdown(f'<div class="desktop-only" style="{header_style}">Exp.</div>', unsafe_allow_html=True)
-    h5.markdown(f'<div class="desktop-only" style="{header_style}">Role Fit</div>', unsafe_allow_html=True)
-    h6.markdown(f'<div class="desktop-only" style="{header_style}">Status</div>', unsafe_allow_html=True)
-
-    for i, c in enumerate(cands):
-        rank  = c["rank"]
-        name  = c.get("candidate_name","—")
-        tot   = c["total_score"]
-        bd    = c.get("score_breakdown",{})
-        sk    = bd.get("skill_match",0)
-        ex    = bd.get("experience_alignment",0)
-        rf    = bd.get("role_relevance",0)
-        pct   = int(tot*100)
-        fg,bg2,bd2 = scolor(tot)
-        lbl   = slabel(tot)
-        
-        is_picked = (picked == name)
-        row_bg = BLUE_LT if is_picked else SURFACE
-        
-        # ── DESKTOP ROW (Columns) ──
-        rs = f"background:{row_bg}; padding:16px 6px; border-bottom:1px solid {BORDER}; min-height:70px;"
-        r0,r1,r2,r3,r4,r5,r6 = st.columns([.5, 2.5, .8, .8, .8, .8, .9])
-        
-        # Rank
-        r0.markdown(f'<div class="desktop-only" style="{rs} font-size:0.85rem; font-weight:700; color:{T4}; display:flex; align-items:center;">#{rank}</div>', unsafe_allow_html=True)
-        
-        # Name + Boost tag
-        boost_tag = f'<span title="Talent Boost" style="background:{AMBER_LT}; border:1px solid {AMBER_BD}; color:{AMBER}; font-size:0.6rem; padding:2px 8px; border-radius:4px; margin-left:10px; font-weight:700;">BOOST ⭐</span>' if bd.get("boost_applied") else ""
-        r1.markdown(f'<div class="desktop-only" style="{rs} font-size:0.95rem; font-weight:600; color:{T1}; display:flex; align-items:center;">{name}{boost_tag}</div>', unsafe_allow_html=True)
-        
-        # Score
-        r2.markdown(f'<div class="desktop-only" style="{rs} font-size:1.05rem; font-weight:800; color:{fg}; display:flex; align-items:center;">{pct}<small style="font-size:0.65rem; margin-left:1px; opacity:0.8;">%</small></div>', unsafe_allow_html=True)
-        
-        # Metrics
-        for col, val in zip([r3,r4,r5], [sk,ex,rf]):
-            col.markdown(f'<div class="desktop-only" style="{rs}"><div style="font-size:0.75rem; font-weight:600; color:{T2};">{int(val*100)}%</div>{pbar(int(val*100), fg)}</div>', unsafe_allow_html=True)
-            
-        # Status Badge
-        r6.markdown(f'<div class="desktop-only" style="{rs} display:flex; align-items:center; justify-content:flex-start;">{badge(lbl,fg,bg2,bd2)}</div>', unsafe_allow_html=True)
-
-        # ── MOBILE CARD (Single column) ──
-        # Use flat string concatenation to avoid Markdown's 4-space indent code-block trigger
-        m_head = f'<div class="mobile-only" style="background:{row_bg}; border:1px solid {BORDER if not is_picked else BLUE_BD}; border-radius:12px; padding:18px; margin-bottom:14px; box-shadow:0 4px 12px rgba(0,0,0,0.06); border-left:4px solid {fg};">'
-        m_row1 = f'<div style="display:flex;justify-content:space-between;align-items:flex-start;margin-bottom:14px;"><div style="flex:1;"><div style="display:flex;align-items:center;gap:8px;margin-bottom:4px;"><span style="font-size:0.7rem;font-weight:800;color:{T4};text-transform:uppercase;letter-spacing:0.05em;">Rank #{rank}</span>{boost_tag if boost_tag else ""}</div><div style="font-size:1.05rem;font-weight:700;color:{T1};line-height:1.3;">{name}</div></div><div style="text-align:right;"><div style="font-size:1.4rem;font-weight:800;color:{fg};line-height:1;">{pct}<small style="font-size:0.7rem;opacity:0.8;">%</small></div><div style="font-size:0.6rem;color:{T4};text-transform:uppercase;font-weight:700;margin-top:4px;">Match</div></div></div>'
-        m_stats = f'<div style="display:grid;grid-template-columns:1fr 1fr 1fr;gap:12px;margin-bottom:16px;padding:12px;background:{BG};border-radius:8px;border:1px solid {BORDER};"><div><div style="font-size:0.55rem;color:{T3};text-transform:uppercase;font-weight:700;margin-bottom:4px;">Skills</div><div style="font-size:0.85rem;font-weight:800;color:{T1};">{int(sk*100)}%</div></div><div><div style="font-size:0.55rem;color:{T3};text-transform:uppercase;font-weight:700;margin-bottom:4px;">Exp</div><div style="font-size:0.85rem;font-weight:800;color:{T1};">{int(ex*100)}%</div></div><div><div style="font-size:0.55rem;color:{T3};text-transform:uppercase;font-weight:700;margin-bottom:4px;">Role</div><div style="font-size:0.85rem;font-weight:800;color:{T1};">{int(rf*100)}%</div></div></div>'
-        m_foot = f'<div style="display:flex;justify-content:space-between;align-items:center;">{badge(lbl,fg,bg2,bd2)}<div style="font-size:0.72rem;color:{BLUE};font-weight:600;cursor:pointer;">Tap for details →</div></div></div>'
-        
-        st.markdown(m_head + m_row1 + m_stats + m_foot, unsafe_allow_html=True)
+    # Whole table (desktop) and card list (mobile) are each one markdown call;
+    # per-row st.columns spawned 7 layout slots + 7 markdown renders per candidate
+    table_html, cards_html = ranking_markup(job_id, rank_nonce(job_id), res.get("generated_at"), picked)
+    st.html(table_html)
+    st.html(cards_html)
 
     st.markdown(f'<div style="font-size:.72rem;color:{T4};margin-top:10px;">Generated: {res.get("generated_at","")[:19].replace("T"," ")} UTC</div>', unsafe_allow_html=True)
     st.markdown("<div style='height:10px'></div>", unsafe_allow_html=True)
 
     dc, _ = st.columns([1,2])
     with dc:
-        if st.button("Download Report (PDF)", use_container_width=True, key="dl_rpt"):
+        if st.session_state.get(f"rpt_{job_id}") or st.button("Download Report (PDF)", use_container_width=True, key="dl_rpt"):
             with st.spinner("Generating…"):
-                rp = _api_session.get(f"{API_BASE}/rank/{job_id}/report.pdf", timeout=30)
-            if rp.status_code == 200:
+                rpt = fetch_pdf(f"/rank/{job_id}/report.pdf", rank_nonce(job_id))
+            st.session_state[f"rpt_{job_id}"] = bool(rpt)
+            if rpt:
                 safe = res.get("job_title","report").replace(" ","_").lower()
-                st.download_button("Save Report", rp.content, f"ranking_{safe}.pdf", "application/pdf", use_container_width=True, key="sv_rpt")
+                st.download_button("Save Report", rpt, f"ranking_{safe}.pdf", "application/pdf", use_container_width=True, key="sv_rpt")
             else: st.error("Report generation failed.")
 
     # ── Detail panel ──────────────────────────────────────────────────────────
     if picked != "— Select candidate to view details —":
         cn = next((c for c in cands if c.get("candidate_name") == picked), None)
         if cn:
-            fg,bg2,bd2 = scolor(cn["total_score"])
+            fg,bg2,bd2 = cn["_color"]
             bdd = cn.get("score_breakdown",{})
             mat = cn.get("matched_skills",[])
             mis = cn.get("missing_skills",[])
-            expl = cn.get("explanation","")
+            expl = html.escape(cn.get("explanation",""))
             
             st.markdown("<div style='height:24px'></div>", unsafe_allow_html=True)
             dp1, dp2 = st.columns([1, 1], gap="large")
 
             with dp1:
                 # Optimized single-block Score Card
-                rows_html = ""
-                for k, label in [("skill_match", "Skill Match"), ("experience_alignment", "Experience"), ("role_relevance", "Role Fit")]:
-                    val = bdd.get(k, 0)
-                    rows_html += (
-                        f'<div style="margin-bottom:12px;">'
-                        f'<div style="display:flex;justify-content:space-between;margin-bottom:4px;">'
-                        f'<span style="font-size:.78rem;color:{T3};">{label}</span>'
-                        f'<span style="font-size:.78rem;font-weight:700;color:{scolor(val)[0]};">{int(val*100)}%</span>'
-                        f'</div>{pbar(int(val*100), scolor(val)[0])}</div>'
-                    )
-                
-                st.markdown(f"""
+                rows_html = factor_rows(bdd, DETAIL_FACTORS)
+
+                st.html(f"""
                 <div style="background:{SURFACE};border:1px solid {BORDER};border-top:4px solid {fg};border-radius:12px;padding:1.5rem;box-shadow:0 10px 30px rgba(0,0,0,.08);">
                   <div style="display:flex;justify-content:space-between;align-items:flex-start;margin-bottom:1.25rem;">
                     <div>
-                      <div style="font-size:1.1rem;font-weight:800;color:{T1};letter-spacing:-.01em;">{cn.get("candidate_name","—")}</div>
-                      <div style="font-size:.78rem;color:{T3};margin-top:3px;font-weight:500;">Rank #{cn["rank"]} · <span style="color:{fg};font-weight:700;">{slabel(cn["total_score"])} Match</span></div>
+                      <div style="font-size:1.1rem;font-weight:800;color:{T1};letter-spacing:-.01em;">{html.escape(cn.get("candidate_name","—"))}</div>
+                      <div style="font-size:.78rem;color:{T3};margin-top:3px;font-weight:500;">Rank #{cn["rank"]} · <span style="color:{fg};font-weight:700;">{cn["_label"]} Match</span></div>
                     </div>
                     <div style="text-align:right;">
                       <div style="font-size:1.85rem;font-weight:800;color:{fg};line-height:1;">{int(cn["total_score"]*100)}%</div>
@@ -456,111 +815,90 @@ elif page == "Results":
                   </div>
                   {rows_html}
                 </div>
-                """, unsafe_allow_html=True)
+                """)
 
             with dp2:
                 if mat or mis or expl:
                     # Optimized single-block Insights Card
-                    mat_html = f'<div style="font-size:.7rem;font-weight:800;color:{GREEN};text-transform:uppercase;letter-spacing:.08em;margin-bottom:8px;">Matched Skills</div><div style="line-height:2.4;margin-bottom:16px;">' + "".join(skill_chip(s,GREEN,GREEN_LT,GREEN_BD) for s in mat) + '</div>' if mat else ""
-                    gap_html = f'<div style="font-size:.7rem;font-weight:800;color:{RED};text-transform:uppercase;letter-spacing:.08em;margin-bottom:8px;">Skill Gaps</div><div style="line-height:2.4;margin-bottom:16px;">' + "".join(skill_chip(s,RED,RED_LT,RED_BD) for s in mis) + '</div>' if mis else ""
-                    expl_html = f'<div style="font-size:.7rem;font-weight:800;color:{T3};text-transform:uppercase;letter-spacing:.08em;margin-bottom:8px;">Model Rationale</div><div style="background:{BG};border:1px solid {BORDER};border-left:4px solid {BLUE};border-radius:8px;padding:12px 14px;font-size:.825rem;color:{T2};line-height:1.7;">{expl}</div>' if expl else ""
+                    mat_html = f'<div style="font-size:.7rem;font-weight:800;color:{GREEN};text-transform:uppercase;letter-spacing:.08em;margin-bottom:8px;">Matched Skills</div><div style="line-height:2.4;margin-bottom:16px;">' + chips_html(tuple(mat), "match") + '</div>' if mat else ""
+                    gap_html = f'<div style="font-size:.7rem;font-weight:800;color:{RED};text-transform:uppercase;letter-spacing:.08em;margin-bottom:8px;">Skill Gaps</div><div style="line-height:2.4;margin-bottom:16px;">' + chips_html(tuple(mis), "gap") + '</div>' if mis else ""
+                    expl_html = f'<div class="tp-rationale-lbl">Model Rationale</div><div class="tp-rationale">{expl}</div>' if expl else ""
                     
-                    st.markdown(f"""
+                    st.html(f"""
                     <div style="background:{SURFACE};border:1px solid {BORDER};border-radius:12px;padding:1.5rem;box-shadow:0 10px 30px rgba(0,0,0,.08);">
                       {mat_html}
                       {gap_html}
                       {expl_html}
                     </div>
-                    """, unsafe_allow_html=True)
+                    """)
 
 
 # ── PAGE 3: EXPLANATIONS ──────────────────────────────────────────────────────
 elif page == "Explanations":
     pg("Candidate Explanations", "Scoring rationale for each candidate. Model reasoning is assistive only.")
-    jobs, _ = api("get", "/jobs/")
-    if not jobs or not jobs["jobs"]: st.info("Add a job and run scoring first."); st.stop()
-    jopts = {f"{j['title']}  (ID: {j['id']})": j["id"] for j in jobs["jobs"]}  # type: ignore
-    sel = st.selectbox("Job", list(jopts.keys()), label_visibility="collapsed")
-    res, err = api("get", f"/rank/{jopts[sel]}/results")
+    jl, _ = fetch_jobs()
+    if not jl: st.info("Add a job and run scoring first."); st.stop()
+    jopts = job_options(jl)
+    sel = job_select(jopts)
+    res, err = fetch_ranking_results(jopts[sel], rank_nonce(jopts[sel]))
     if err or not res: st.info("Run scoring first."); st.stop()
     cands = res["ranked_candidates"]  # type: ignore
     sec(f"{len(cands)} candidates")
 
-    for i, c in enumerate(cands):
-        rank=c["rank"]
-        name=c.get("candidate_name","—")
-        tot=c["total_score"]
-        hp_badge = " ⭐ " if c.get("high_potential") else ""
-        bdd=c.get("score_breakdown",{})
-        mat=c.get("matched_skills",[])
-        mis=c.get("missing_skills",[])
-        expl=c.get("explanation","")
-        fg,bg2,bd2=scolor(tot)
-        
-        with st.expander(f"#{rank}  {name} {hp_badge} —  {int(tot*100)}%  ({slabel(tot)})"):
-            # Unified Insight Block using CSS Grid for maximum rendering stability inside expanders
-            mat_html = "".join([skill_chip(s, GREEN, GREEN_LT, GREEN_BD) for s in mat])
-            mis_html = "".join([skill_chip(s, RED, RED_LT, RED_BD) for s in mis])
-            
-            rows_html = ""
-            for k, label in [("total", "Overall Alignment"), ("skill_match", "Technical Fit"), ("experience_alignment", "Experience Fit"), ("role_relevance", "Mission Fit")]:
-                val = bdd.get(k, tot) if k == "total" else bdd.get(k, 0)
-                rows_html += (
-                    f'<div style="margin-bottom:12px;">'
-                    f'<div style="display:flex;justify-content:space-between;margin-bottom:4px;">'
-                    f'<span style="font-size:.78rem;color:{T3};">{label}</span>'
-                    f'<span style="font-size:.78rem;font-weight:700;color:{scolor(val)[0]};">{int(val*100)}%</span>'
-                    f'</div>{pbar(int(val*100), scolor(val)[0])}</div>'
-                )
-
-            st.markdown(  # type: ignore
-                f"""
-                <div style="background:{SURFACE}; border:1px solid {BORDER}; border-radius:12px; padding:1.5rem; margin:10px 0; box-shadow:0 10px 30px rgba(0,0,0,.04);">
-                    <div class="insight-grid" style="display:grid; grid-template-columns: 1fr 1.2fr; gap:2.5rem;">
-                        <div>
-                            <div style="font-size:0.75rem; font-weight:800; color:{T3}; text-transform:uppercase; letter-spacing:0.08em; margin-bottom:15px; border-bottom:1px solid {BORDER}; padding-bottom:8px;">Score Breakdown</div>
-                            {rows_html}
-                        </div>
-                        <div>
-                            <div style="font-size:0.75rem; font-weight:800; color:{T3}; text-transform:uppercase; letter-spacing:0.08em; margin-bottom:15px; border-bottom:1px solid {BORDER}; padding-bottom:8px;">Technical Insights</div>
-                            <div style="margin-bottom:15px;">
-                                <div style="font-size:0.65rem; font-weight:700; color:{GREEN}; text-transform:uppercase; margin-bottom:6px;">Matched Skills</div>
-                                <div style="line-height:2.2;">{mat_html if mat else '<span style="color:'+T4+'; font-style:italic; font-size:0.8rem;">None detected</span>'}</div>
-                            </div>
-                            <div>
-                                <div style="font-size:0.65rem; font-weight:700; color:{RED}; text-transform:uppercase; margin-bottom:6px;">Skill Gaps</div>
-                                <div style="line-height:2.2;">{mis_html if mis else '<span style="color:'+T4+'; font-style:italic; font-size:0.8rem;">None detected</span>'}</div>
-                            </div>
-                        </div>
+    # Only the selected candidate's breakdown is built; collapsed expanders still
+    # rendered every candidate's full block on each rerun
+    titles = [f"#{c['rank']}  {c.get('candidate_name','—')} {' ⭐ ' if c.get('high_potential') else ''} —  {c['_pct']}%  ({c['_label']})"
+              for c in cands]
+    pick = st.radio("Candidate", range(len(cands)), format_func=titles.__getitem__,
+                    key=f"expl_{jopts[sel]}", label_visibility="collapsed")
+    c = cands[pick]
+    rank=c["rank"]
+    tot=c["total_score"]
+    bdd=c.get("score_breakdown",{})
+    mat=c.get("matched_skills",[])
+    mis=c.get("missing_skills",[])
+    expl=html.escape(c.get("explanation",""))
+    
+    # Unified Insight Block using CSS Grid for maximum rendering stability
+    mat_html = chips_html(tuple(mat), "match")
+    mis_html = chips_html(tuple(mis), "gap")
+    
+    rows_html = factor_rows(bdd, INSIGHT_FACTORS, tot)
+
+    st.html(  # type: ignore
+        f"""
+        <div style="background:{SURFACE}; border:1px solid {BORDER}; border-radius:12px; padding:1.5rem; margin:10px 0; box-shadow:0 10px 30px rgba(0,0,0,.04);">
+            <div class="insight-grid" style="display:grid; grid-template-columns: 1fr 1.2fr; gap:2.5rem;">
+                <div>
+                    <div style="font-size:0.75rem; font-weight:800; color:{T3}; text-transform:uppercase; letter-spacing:0.08em; margin-bottom:15px; border-bottom:1px solid {BORDER}; padding-bottom:8px;">Score Breakdown</div>
+                    {rows_html}
+                </div>
+                <div>
+                    <div style="font-size:0.75rem; font-weight:800; color:{T3}; text-transform:uppercase; letter-spacing:0.08em; margin-bottom:15px; border-bottom:1px solid {BORDER}; padding-bottom:8px;">Technical Insights</div>
+                    <div style="margin-bottom:15px;">
+                        <div style="font-size:0.65rem; font-weight:700; color:{GREEN}; text-transform:uppercase; margin-bottom:6px;">Matched Skills</div>
+                        <div style="line-height:2.2;">{mat_html if mat else '<span style="color:'+T4+'; font-style:italic; font-size:0.8rem;">None detected</span>'}</div>
                     </div>
-                    <div style="background: {BG}; border: 1px solid {BORDER}; border-left: 4px solid {BLUE}; border-radius: 8px; padding: 1rem; margin-top: 1.5rem;">
-                        <div style="font-size: 0.65rem; font-weight: 800; color: {T3}; text-transform: uppercase; letter-spacing: 0.1em; margin-bottom: 8px;">Model Rationale (Assistive)</div>
-                        <div style="font-size: 0.85rem; color: {T1}; line-height: 1.6; font-family: 'Inter', sans-serif;">{expl}</div>
+                    <div>
+                        <div style="font-size:0.65rem; font-weight:700; color:{RED}; text-transform:uppercase; margin-bottom:6px;">Skill Gaps</div>
+                        <div style="line-height:2.2;">{mis_html if mis else '<span style="color:'+T4+'; font-style:italic; font-size:0.8rem;">None detected</span>'}</div>
                     </div>
                 </div>
-                <style>
-                    @media (max-width: 800px) {{
-                        .insight-grid {{ grid-template-columns: 1fr !important; gap: 1.5rem !important; }}
-                    }}
-                </style>
-            """, unsafe_allow_html=True)  # type: ignore
-            
-            # Integrated Document Explorer
-            show_text = st.toggle("Document Explorer", key=f"etog_{c['resume_id']}_{rank}")  # type: ignore
-            if show_text:
-                rd2, _ = api("get", f"/resumes/{c['resume_id']}")
-                if rd2:
-                    txt = rd2.get("raw_text", "")
-                    st.markdown(  # type: ignore
-                        f"""
-                        <div style="background:{SURFACE}; border: 1px solid {BORDER}; border-radius: 8px; padding: 1.25rem; margin-top: 12px; box-shadow: 0 4px 12px rgba(0,0,0,0.05);">
-                            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 12px; border-bottom: 1px solid {BORDER}; padding-bottom: 8px;">
-                                <span style="font-size: 0.62rem; font-weight: 800; color: {T3}; text-transform: uppercase; letter-spacing: 0.1em;">Resume Source Transcript</span>
-                                <span style="font-size: 0.62rem; color: {T4};">{len(txt)} chars</span>
-                            </div>
-                            <div style="font-size: 0.8rem; color: {T2}; line-height: 1.7; max-height: 350px; overflow-y: auto; white-space: pre-wrap; font-family: 'Inter', system-ui, sans-serif;">{txt}</div>
-                        </div>
-                    """, unsafe_allow_html=True)
+            </div>
+            <div class="tp-rationale assistive">
+                <div class="tp-rationale-lbl">Model Rationale (Assistive)</div>
+                <div class="tp-rationale-text">{expl}</div>
+            </div>
+        </div>
+    """)  # type: ignore
+    
+    # Integrated Document Explorer
+    show_text = st.toggle("Document Explorer", key=f"etog_{c['resume_id']}_{rank}")  # type: ignore
+    if show_text:
+        rd2, _ = api("get", f"/resumes/{c['resume_id']}")
+        if rd2:
+            txt = rd2.get("raw_text", "")
+            doc_viewer("Resume Source Transcript", txt, f"efull_{c['resume_id']}_{rank}")
 
 
 # ── PAGE 4: FAIRNESS AUDIT ────────────────────────────────────────────────────
@@ -568,24 +906,30 @@ elif page == "Fairness Audit":
     pg("Fairness Audit", "Statistical signals in scoring patterns. Review before finalising decisions.")
     st.markdown(f'<div style="background:{AMBER_LT};border:1px solid {AMBER_BD};border-radius:8px;padding:10px 14px;margin-bottom:1rem;font-size:.8rem;color:{AMBER};line-height:1.6;"><b>Note:</b> This page audits <b>Scoring Fairness</b> (how the AI ranks). To record your <b>Decisions</b> (Progress/Decline), use the <b>Feedback</b> page.</div>', unsafe_allow_html=True)
 
-    jobs, _ = api("get", "/jobs/")
-    if not jobs or not jobs["jobs"]: st.info("Add a job and run scoring first."); st.stop()
-    jopts = {f"{j['title']}  (ID: {j['id']})": j["id"] for j in jobs["jobs"]}  # type: ignore
-    sel = st.selectbox("Job", list(jopts.keys()), label_visibility="collapsed")
+    jl, _ = fetch_jobs()
+    if not jl: st.info("Add a job and run scoring first."); st.stop()
+    jopts = job_options(jl)
+    sel = job_select(jopts)
     jid = jopts[sel]
+    # Reports are keyed on the scoring run, so a re-rank invalidates them and an
+    # unchanged run is served from the st.cache_data entry
+    ranked, _ = fetch_ranking_results(jid, rank_nonce(jid))
+    run_stamp = [c.get("created_at") for c in (ranked or {}).get("ranked_candidates", [])]
+    version = hashlib.md5(str(run_stamp).encode()).hexdigest()[:8]
+    rep = None
     if st.button("Run Fairness Analysis"):
+        # A fresh key recomputes for this session without dropping other sessions' reports
+        st.session_state[f"bias_nonce_{jid}"] = time.time()
+        run_stamp = run_stamp or [None]
+    if run_stamp:
         with st.spinner("Analysing…"):
-            r, e = api("get", f"/bias/{jid}")
+            rep, e = fetch_bias_report(jid, version, st.session_state.get(f"bias_nonce_{jid}", 0))
         if e: st.error(e); st.stop()
-        st.session_state[f"bias_{jid}"] = r
-
-    rep = st.session_state.get(f"bias_{jid}")
     if not rep:
-        info_card(f'<div style="text-align:center;padding:2rem 0;font-size:.9rem;color:{T3};">Select a job and click <b style="color:{T1};">Run Fairness Analysis</b>.</div>')
+        st.markdown(EMPTY_AUDIT, unsafe_allow_html=True)
         st.stop()
 
     skew=rep.get("experience_skew_score",0); kw=rep.get("keyword_overfit_score",0); ns=len(rep.get("bias_signals",[]))
-    def bc(v,lo=.45,hi=.7): return RED if v>=hi else AMBER if v>=lo else GREEN
     fa1,fa2,fa3=st.columns(3)
     with fa1: st.metric("Experience Skew", f"{skew:.2f}", help="Spearman correlation (0 to 1). High values mean rankings match years of experience perfectly.")
     with fa2: st.metric("Keyword Overfit", f"{kw:.2f}", help="Spearman correlation (0 to 1). High values mean rankings match keyword counts perfectly.")
@@ -594,130 +938,63 @@ elif page == "Fairness Audit":
     fd=rep.get("factor_dominance",[])
     if fd:
         sec("Factor Contribution")
-        fig=go.Figure(go.Bar(
-            x=[f["factor_name"].replace("_"," ").title() for f in fd],
-            y=[f["average_contribution"] for f in fd],
-            marker={"color":[BLUE,GREEN,AMBER],"line":{"width":0}},
-            text=[f"{f['average_contribution']:.3f}" for f in fd],
-            textposition="outside",textfont={"color":T3,"size":11},
-        ))
-        fig.update_layout(paper_bgcolor=BG,plot_bgcolor=SURFACE,
-            font={"color":T3,"family":"Inter"},
-            yaxis={"gridcolor":BORDER,"zeroline":False},
-            margin={"t":24,"b":8,"l":8,"r":8},showlegend=False,height=220,bargap=.45)
-        st.plotly_chart(fig,use_container_width=True)
+        # Deferred: the figure is only built and shipped to the browser on request
+        if st.toggle("Show factor contribution chart", key=f"fd_tog_{jid}"):
+            fd_key = tuple((f["factor_name"], round(f["average_contribution"], 6)) for f in fd)
+            st.vega_lite_chart(factor_chart_spec(fd_key), use_container_width=True)
 
     sec("Flagged Signals")
     sigs=rep.get("bias_signals",[])
-    scm={"high":(RED,RED_LT,RED_BD),"medium":(AMBER,AMBER_LT,AMBER_BD),"low":(GREEN,GREEN_LT,GREEN_BD)}
     if not sigs:
-        st.markdown(f"""
-        <div style="background:{GREEN_LT};border:1px solid {GREEN_BD};border-radius:12px;padding:1.5rem;box-shadow:0 4px 15px rgba(15,123,85,.05);">
-          <div style="display:flex;align-items:center;gap:12px;margin-bottom:1rem;">
-            <div style="background:{GREEN};color:#fff;width:24px;height:24px;border-radius:50%;display:flex;align-items:center;justify-content:center;font-size:.8rem;font-weight:900;">✓</div>
-            <div style="font-size:1rem;font-weight:700;color:{GREEN};">Fairness Verification Passed</div>
-          </div>
-          <p style="font-size:.825rem;color:{T2};line-height:1.6;margin-bottom:1rem;">The audit has completed. No statistically significant bias markers were found in this ranking cycle. The score distribution aligns with job-relevant requirements.</p>
-          <div style="display:grid;grid-template-columns:1fr 1fr;gap:10px;">
-            <div style="display:flex;align-items:center;gap:8px;font-size:.78rem;color:{T3};"><span style="color:{GREEN};">●</span> Gender-Neutral Language check</div>
-            <div style="display:flex;align-items:center;gap:8px;font-size:.78rem;color:{T3};"><span style="color:{GREEN};">●</span> Age-Bias Trigger check</div>
-            <div style="display:flex;align-items:center;gap:8px;font-size:.78rem;color:{T3};"><span style="color:{GREEN};">●</span> Keyword Over-Optimization check</div>
-            <div style="display:flex;align-items:center;gap:8px;font-size:.78rem;color:{T3};"><span style="color:{GREEN};">●</span> Geographic Proxy check</div>
-          </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(AUDIT_PASSED, unsafe_allow_html=True)
     else:
-        for sg in sigs:
-            sev=sg.get("severity","low"); fg2,bg2,bd3=scm.get(sev,scm["low"])
-            affected = sg.get("affected_candidates", [])
-            affected_html = ""
-            if affected:
-                names = ", ".join([a["name"] for a in affected])
-                affected_html = f'<div style="margin-top:8px;font-size:.75rem;font-weight:700;color:{fg2};">Influential Candidates: <span style="font-weight:400;color:{T2};">{names}</span></div>'
-            
-            st.markdown(f'<div style="background:{SURFACE};border:1px solid {bd3};border-left:4px solid {fg2};border-radius:8px;padding:.9rem 1.1rem;margin-bottom:8px;"><div style="display:flex;align-items:center;gap:8px;margin-bottom:5px;"><span style="background:{bg2};color:{fg2};font-size:.68rem;font-weight:700;padding:2px 8px;border-radius:20px;text-transform:uppercase;">{sev}</span><span style="color:{T1};font-weight:600;font-size:.875rem;">{sg.get("signal_type","").replace("_"," ").title()}</span></div><div style="font-size:.8125rem;color:{T2};line-height:1.65;">{sg.get("description","")}</div>{affected_html}</div>', unsafe_allow_html=True)
+        # All signal cards go out as one element
+        st.html("".join(SIGNAL_TPL({
+            "sev": sg.get("severity","low") if sg.get("severity") in SEVERITIES else "low",
+            "title": sg.get("signal_type","").replace("_"," ").title(),
+            "desc": html.escape(sg.get("description","")),
+            "affected": AFFECTED_TPL(names=html.escape(sg["affected_names"])) if sg.get("affected_names") else "",
+        }) for sg in sigs))
 
     sec("Ethical Disclaimer")
-    st.markdown(f'<div style="background:{BG};border:1px solid {BORDER};border-radius:8px;padding:1rem 1.25rem;font-size:.8125rem;color:{T2};line-height:1.7;">{rep.get("ethical_disclaimer","")}</div>', unsafe_allow_html=True)
+    st.markdown(f'<div class="tp-note">{html.escape(rep.get("ethical_disclaimer",""))}</div>', unsafe_allow_html=True)
 
-    with st.container():
-        st.markdown(f"""
-        <div style="margin-top:2rem;padding:1.5rem;background:{BLUE_LT};border:1px solid {BLUE_BD};border-radius:12px;">
-          <div style="font-size:1rem;font-weight:700;color:{BLUE};margin-bottom:.5rem;">🛡️ Candidate Advocacy & Professionalism</div>
-          <p style="font-size:.825rem;color:{T2};line-height:1.6;">
-            <b>The "YoE Blind Spot":</b> Candidates often forget to explicitly state their total years of experience, or use varied date formats. 
-            If a top candidate is ranked lower than expected, check if they have a <b>Skill Match</b> > 0.80. This usually indicates a 
-            strong profile despite detected tenure gaps.
-          </p>
-          <p style="font-size:.825rem;color:{T2};line-height:1.6;margin-top:.5rem;">
-            <b>Talent Boost:</b> The system automatically applies a 40% penalty-dampening boost (⭐) to candidates who show exceptional 
-            role relevance and skills, even if their experience count is low. This ensures we don't miss "Fast Track" talent.
-          </p>
-        </div>
-        """, unsafe_allow_html=True)
+    with st.expander("🛡️ Candidate Advocacy & Professionalism", expanded=False):
+        st.markdown(ADVOCACY_HTML, unsafe_allow_html=True)
 
 
 # ── PAGE 5: FEEDBACK ──────────────────────────────────────────────────────────
 elif page == "Feedback":
     pg("Recruiter Feedback", "Record your decision on each candidate. Feedback is optional and calibrates future scoring.")
-    jobs, _ = api("get", "/jobs/")
-    if not jobs or not jobs["jobs"]: st.info("Add a job and run scoring first."); st.stop()
-    jopts = {f"{j['title']}  (ID: {j['id']})": j["id"] for j in jobs["jobs"]}  # type: ignore
-    sel = st.selectbox("Job", list(jopts.keys()), label_visibility="collapsed")
-    res, err = api("get", f"/rank/{jopts[sel]}/results")
+    jl, _ = fetch_jobs()
+    if not jl: st.info("Add a job and run scoring first."); st.stop()
+    jopts = job_options(jl)
+    fsel, fref = st.columns([5,1])
+    with fsel: sel = job_select(jopts)
+    with fref:
+        if st.button("Refresh", key="fb_refresh", use_container_width=True):
+            fetch_jobs.clear(); _feedback_view.clear(); fetch_job_feedback.clear()
+            st.rerun()
+    res, err = fetch_feedback_view(jopts[sel], rank_nonce(jopts[sel]))
     if err or not res: st.info("Run scoring first."); st.stop()
     cands = res["ranked_candidates"]  # type: ignore
 
-    # Fetch feedback stats for this specific job
-    stats, _ = api("get", f"/feedback/stats?job_id={jopts[sel]}")
-    if stats and res is not None:
+    # Feedback stats for this job arrive embedded in the results payload
+    stats = res.get("feedback_stats")
+    if stats:
         job_title = str(res.get("job_title", ""))
-        sec(f"Feedback Summary — {job_title}")
-        tf=stats.get("total_feedback",0); ac=stats.get("accept_count",0); rj=stats.get("reject_count",0)
-        fs1,fs2,fs3,fs4=st.columns(4)
-        with fs1: stat_box(tf,"Total Submitted")
-        with fs2: stat_box(ac,"Progressed",GREEN)
-        with fs3: stat_box(rj,"Declined",RED)
-        with fs4: stat_box(f"{int(ac/tf*100)}%" if tf else "—","Progress Rate")
+        sec(f"Feedback Summary — {html.escape(job_title)}")
+        tf, ac, rj = (stats.get(k) or 0 for k in ("total_feedback", "accept_count", "reject_count"))
+        specs=((tf,"Total Submitted",BLUE),(ac,"Progressed",GREEN),(rj,"Declined",RED),
+               (f"{ac*100//tf}%" if tf else "—","Progress Rate",BLUE))
+        stat_row(specs)
     
     # Fetch all feedback for this job to map current decisions
-    fb_res, _ = api("get", f"/feedback/job/{jopts[sel]}")
+    fb_res = fetch_job_feedback(jopts[sel])
+    # Feedback is newest-first; iterating reversed lets the newest decision win
     fb_map = {}
     if isinstance(fb_res, dict) and "feedback" in fb_res:
-        for f in fb_res["feedback"]:
-            if f["ranking_id"] not in fb_map:
-                fb_map[f["ranking_id"]] = f["decision"]
+        fb_map = {f["ranking_id"]: f["decision"] for f in reversed(fb_res["feedback"])}
 
     sec("Review Queue")
-    for c in cands:
-        rid=c.get("ranking_id")
-        if not rid: continue
-        name=c.get("candidate_name","—"); rank=c["rank"]; tot=c["total_score"]
-        fg,bg2,bd2=scolor(tot)
-        prev = fb_map.get(rid)
-        status_badge = ""
-        if prev == "accept":
-            status_badge = f' {badge("PROGRESSED", GREEN, GREEN_LT, GREEN_BD)}'
-        elif prev == "reject":
-            status_badge = f' {badge("DECLINED", RED, RED_LT, RED_BD)}'
-        else:
-            status_badge = f' {badge("PENDING", T4, SURFACE, BORDER)}'
-
-        html = f'<div style="background:{SURFACE};border:1px solid {BORDER};border-radius:8px;padding:.85rem 1.25rem;margin-bottom:4px;display:flex;align-items:center;gap:12px;box-shadow:0 1px 6px rgba(0,0,0,.05);"><div style="font-size:.8rem;font-weight:700;color:{T3};min-width:28px;text-align:center;">#{rank}</div><div style="flex:1;font-size:.9rem;font-weight:600;color:{T1};">{name}</div><div style="font-size:.85rem;font-weight:800;color:{fg};margin-right:8px;">{int(tot*100)}%</div>{status_badge} {str(badge(slabel(tot),fg,bg2,bd2))}</div>'
-        st.markdown(html, unsafe_allow_html=True)
-        fc1,fc2,fc3=st.columns([1,2,1])
-        with fc1:
-            prev = fb_map.get(rid)
-            idx = 0 if prev == "accept" else 1 if prev == "reject" else 0
-            dec=st.radio("",["Progress","Decline"],index=idx,key=f"d_{rid}",horizontal=True,label_visibility="collapsed")
-        with fc2:
-            notes=st.text_input("",key=f"n_{rid}",placeholder="Optional notes…",label_visibility="collapsed")
-        with fc3:
-            if st.button("Submit",key=f"s_{rid}",use_container_width=True):
-                resp,ferr=api("post","/feedback/",json={"ranking_id":rid,"decision":"accept" if dec=="Progress" else "reject","notes":notes})
-                if resp:
-                    msg=f"{name}: {dec}d"
-                    if resp.get("weight_adjustment_triggered"): msg+=" — weights updated"
-                    st.success(msg)
-                else: st.error(ferr)
-        st.markdown("<div style='height:4px;'></div>", unsafe_allow_html=True)
+    review_queue(jopts[sel], cands, fb_map)
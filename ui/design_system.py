@@ -5,6 +5,10 @@ CRITICAL: DO NOT MODIFY THIS FILE WITHOUT EXPLICIT USER CONSENT.
 This file contains the hardcoded "Gold Standard" UI/UX tokens, colors, and global CSS.
 """
 
+import html
+import re
+from functools import lru_cache
+
 import streamlit as st  # type: ignore
 
 # ── Color Palette (Enterprise v3 Gold Standard) ──────────────────────────────────
@@ -38,15 +42,14 @@ T2       = "#374151"
 T3       = "#6B7280"
 T4       = "#9CA3AF"
 
-def inject_custom_css():
-    """
-    Injects the finalized Enterprise v3 CSS into the Streamlit app.
-    Locks in font (Inter), spacing, animations, and component styling.
-    """
-    css = f"""
+# Palette is substituted once at import; reruns reuse the finished string.
+# Inter is pulled in with <link> tags rather than a CSS @import, so the rest of the
+# stylesheet is parsed without waiting on the Google Fonts round-trip
+CSS = f"""
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap">
 <style>
-@import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
-
 *{{box-sizing:border-box;}}
 
 /* Global Background & Font */
@@ -79,26 +82,30 @@ header[data-testid="stHeader"], [data-testid="stHeader"], [data-testid="stAppHea
   font-size:.875rem!important;font-weight:500!important;
   color:{T2}!important;padding:9px 14px!important;
   border-radius:8px!important;border:1px solid transparent!important;
-  transition:all .18s!important;cursor:pointer!important;width:100%!important;
+  transition:background-color .18s,color .18s,border-color .18s!important;cursor:pointer!important;width:100%!important;
 }}
 [data-testid="stSidebar"] .stRadio label:hover{{
   background:{BLUE_LT}!important;color:{BLUE}!important;border-color:{BLUE_BD}!important;
 }}
 
 /* Primary Buttons */
-.stButton>button{{
+.stButton>button,[data-testid="stFormSubmitButton"]>button{{
   background:{BLUE}!important;color:#fff!important;
   border:none!important;border-radius:8px!important;
   font-weight:600!important;font-size:.8125rem!important;
   padding:.5rem 1.1rem!important;min-height:38px!important;
-  white-space:nowrap!important;transition:all .18s!important;
+  white-space:nowrap!important;transition:background-color .18s,box-shadow .18s,transform .18s!important;
   box-shadow:0 2px 10px rgba(47,91,234,.28)!important;
 }}
-.stButton>button:hover{{
-  background:{BLUE_DK}!important;transform:translateY(-1px)!important;
+.stButton>button:hover,[data-testid="stFormSubmitButton"]>button:hover{{
+  background:{BLUE_DK}!important;
   box-shadow:0 4px 18px rgba(47,91,234,.38)!important;
 }}
-.stButton>button:active{{transform:translateY(0)!important;}}
+/* The lift is motion, so only apply it when the user has not asked for less */
+@media (prefers-reduced-motion: no-preference) {{
+  .stButton>button:hover,[data-testid="stFormSubmitButton"]>button:hover{{transform:translateY(-1px)!important;}}
+  .stButton>button:active,[data-testid="stFormSubmitButton"]>button:active{{transform:translateY(0)!important;}}
+}}
 
 /* Download Buttons (Ghost style) */
 [data-testid="stDownloadButton"]>button{{
@@ -106,7 +113,7 @@ header[data-testid="stHeader"], [data-testid="stHeader"], [data-testid="stAppHea
   border:1.5px solid {BLUE}!important;border-radius:8px!important;
   font-weight:600!important;font-size:.8125rem!important;
   padding:.5rem 1.1rem!important;min-height:38px!important;
-  white-space:nowrap!important;transition:all .18s!important;
+  white-space:nowrap!important;transition:background-color .18s!important;
 }}
 [data-testid="stDownloadButton"]>button:hover{{background:{BLUE_LT}!important;}}
 
@@ -168,6 +175,106 @@ hr{{border-color:{BORDER}!important;}}
 /* Hide Main Menu/Footer Completely */
 #MainMenu,footer,header{{visibility:hidden!important;}}
 
+/* ── Component Classes (shared by app.py HTML fragments) ─────────────── */
+/* Model rationale callout */
+.tp-rationale{{
+  background:{BG};border:1px solid {BORDER};border-left:4px solid {BLUE};
+  border-radius:8px;padding:12px 14px;font-size:.825rem;color:{T2};line-height:1.7;
+}}
+.tp-rationale-lbl{{
+  font-size:.7rem;font-weight:800;color:{T3};text-transform:uppercase;
+  letter-spacing:.08em;margin-bottom:8px;
+}}
+.tp-rationale.assistive{{padding:1rem;margin-top:1.5rem;}}
+.tp-rationale.assistive .tp-rationale-lbl{{font-size:.65rem;letter-spacing:.1em;}}
+.tp-rationale-text{{font-size:.85rem;color:{T1};line-height:1.6;font-family:'Inter',sans-serif;}}
+
+/* Document Explorer */
+.tp-doc{{
+  background:{SURFACE};border:1px solid {BORDER};border-radius:8px;
+  padding:1.25rem;margin-top:12px;box-shadow:0 4px 12px rgba(0,0,0,0.05);
+}}
+.tp-doc.muted{{background:{BG};box-shadow:0 4px 6px -1px rgba(0,0,0,0.05);}}
+.tp-doc-head{{
+  display:flex;justify-content:space-between;align-items:center;
+  margin-bottom:12px;border-bottom:1px solid {BORDER};padding-bottom:8px;
+}}
+.tp-doc-title{{font-size:.62rem;font-weight:800;color:{T3};text-transform:uppercase;letter-spacing:.1em;}}
+.tp-doc-meta{{font-size:.62rem;color:{T4};}}
+.tp-doc-head:last-child{{margin-bottom:0;border-bottom:none;padding-bottom:0;}}
+.tp-doc.muted .tp-doc-title,.tp-doc.muted .tp-doc-meta{{font-size:.65rem;}}
+
+/* Bias signal cards — severity is a modifier class */
+.tp-signal{{
+  background:{SURFACE};border:1px solid {GREEN_BD};border-left:4px solid {GREEN};
+  border-radius:8px;padding:.9rem 1.1rem;margin-bottom:8px;
+}}
+.tp-signal-head{{display:flex;align-items:center;gap:8px;margin-bottom:5px;}}
+.tp-sev{{
+  background:{GREEN_LT};color:{GREEN};font-size:.68rem;font-weight:700;
+  padding:2px 8px;border-radius:20px;text-transform:uppercase;
+}}
+.tp-signal-title{{color:{T1};font-weight:600;font-size:.875rem;}}
+.tp-signal-desc{{font-size:.8125rem;color:{T2};line-height:1.65;}}
+.tp-affected{{margin-top:8px;font-size:.75rem;font-weight:700;color:{GREEN};}}
+.tp-affected span{{font-weight:400;color:{T2};}}
+.tp-signal.high{{border-color:{RED_BD};border-left-color:{RED};}}
+.tp-signal.high .tp-sev{{background:{RED_LT};color:{RED};}}
+.tp-signal.high .tp-affected{{color:{RED};}}
+.tp-signal.medium{{border-color:{AMBER_BD};border-left-color:{AMBER};}}
+.tp-signal.medium .tp-sev{{background:{AMBER_LT};color:{AMBER};}}
+.tp-signal.medium .tp-affected{{color:{AMBER};}}
+
+/* Ethical disclaimer */
+.tp-note{{
+  background:{BG};border:1px solid {BORDER};border-radius:8px;
+  padding:1rem 1.25rem;font-size:.8125rem;color:{T2};line-height:1.7;
+}}
+
+/* Candidate advocacy block */
+.tp-advocacy{{
+  padding:1.25rem 1.5rem;background:{BLUE_LT};
+  border:1px solid {BLUE_BD};border-radius:12px;
+}}
+.tp-advocacy p{{font-size:.825rem;color:{T2};line-height:1.6;}}
+.tp-advocacy p+p{{margin-top:.5rem;}}
+
+/* Explanations insight grid collapses to one column on narrow screens */
+@media (max-width: 800px) {{
+  .insight-grid {{ grid-template-columns: 1fr !important; gap: 1.5rem !important; }}
+}}
+
+/* Results ranking table */
+.tp-rank-tbl{{width:100%;border-collapse:collapse;table-layout:fixed;margin:0;}}
+.tp-rank-tbl th,.tp-rank-tbl td{{border:none;border-bottom:1px solid {BORDER};text-align:left;}}
+.tp-rank-tbl th{{
+  font-size:0.68rem;font-weight:800;color:{T4};text-transform:uppercase;
+  letter-spacing:0.12em;padding:0 6px 12px;background:transparent;
+}}
+.tp-rank-tbl td{{padding:16px 6px;height:70px;vertical-align:middle;background:{SURFACE};}}
+.tp-rank-tbl tr.picked td{{background:{BLUE_LT};}}
+.tp-rank-tbl .rk{{font-size:0.85rem;font-weight:700;color:{T4};}}
+.tp-rank-tbl .nm{{font-size:0.95rem;font-weight:600;color:{T1};}}
+.tp-rank-tbl .sc{{font-size:1.05rem;font-weight:800;}}
+.tp-rank-tbl .sc small{{font-size:0.65rem;margin-left:1px;opacity:0.8;}}
+.tp-rank-tbl .mv{{font-size:0.75rem;font-weight:600;color:{T2};}}
+
+/* Stat box row */
+.tp-stat-row{{display:grid;grid-template-columns:repeat(4,1fr);gap:1rem;}}
+
+/* Feedback review row */
+.tp-fb-row{{
+  background:{SURFACE};border:1px solid {BORDER};border-radius:8px;
+  padding:.85rem 1.25rem;margin-bottom:4px;display:flex;align-items:center;
+  gap:12px;box-shadow:0 1px 6px rgba(0,0,0,.05);
+}}
+.tp-fb-rank{{font-size:.8rem;font-weight:700;color:{T3};min-width:28px;text-align:center;}}
+.tp-fb-name{{flex:1;font-size:.9rem;font-weight:600;color:{T1};}}
+.tp-fb-score{{font-size:.85rem;font-weight:800;margin-right:8px;}}
+/* Keyed per-row buttons carry their own spacing, replacing spacer elements */
+[class*="st-key-del_r_"]{{margin-top:8px;}}
+[data-testid="stForm"]{{margin-bottom:4px;}}
+
 /* Animations */
 @keyframes fadeIn{{from{{opacity:0;}}to{{opacity:1;}}}}
 .fade{{animation:fadeIn .3s ease both;}}
@@ -193,7 +300,66 @@ hr{{border-color:{BORDER}!important;}}
   /* Adjust stat box text sizes */
   .stat-val {{ font-size: 1.3rem !important; }}
   .stat-lbl {{ font-size: 0.6rem !important; }}
+  .tp-stat-row {{ grid-template-columns: repeat(2, 1fr); gap: .75rem; }}
 }}
 </style>
+"""
+
+
+def _minify_css(markup):
+    """Strip comments and layout whitespace inside <style>; the injected block is re-sent on every rerun."""
+    def squeeze(m):
+        css = re.sub(r"/\*.*?\*/", "", m.group(1), flags=re.S)
+        css = re.sub(r"\s+", " ", css)
+        css = re.sub(r"\s*([{};,>])\s*", r"\1", css).replace(": ", ":").replace(";}", "}")
+        return "<style>" + css.strip() + "</style>"
+    return re.sub(r"<style>(.*?)</style>", squeeze, markup, flags=re.S)
+
+
+CSS = _minify_css(CSS)
+
+def inject_custom_css():
+    """
+    Injects the finalized Enterprise v3 CSS into the Streamlit app.
+    Locks in font (Inter), spacing, animations, and component styling.
     """
-    st.markdown(css, unsafe_allow_html=True)
+    st.markdown(CSS, unsafe_allow_html=True)
+
+
+# ── Markup helpers ────────────────────────────────────────────────────────────
+# These live here rather than in app.py because Streamlit re-executes the app
+# script on every rerun, which would discard an lru_cache defined there.
+@lru_cache(maxsize=4096)
+def pbar(pct, col):
+    """Clean, single-line progress bar to prevent Streamlit rendering bugs."""
+    return f'<div style="background:{BORDER};border-radius:99px;height:4px;overflow:hidden;margin-top:6px;width:100%;border:0.5px solid {BORDER};"><div style="background:{col};width:{pct}%;height:100%;border-radius:99px;"></div></div>'
+
+@lru_cache(maxsize=1024)
+def factor_bar(label, pct, col):
+    """Labelled sub-score row (name, percent, progress bar) for score cards."""
+    return (f'<div style="margin-bottom:12px;"><div style="display:flex;justify-content:space-between;margin-bottom:4px;">'
+            f'<span style="font-size:.78rem;color:{T3};">{label}</span>'
+            f'<span style="font-size:.78rem;font-weight:700;color:{col};">{pct}%</span></div>{pbar(pct, col)}</div>')
+
+CHIP_PALETTE = {"match": (GREEN, GREEN_LT, GREEN_BD), "gap": (RED, RED_LT, RED_BD)}
+# Style prefix/suffix per chip kind, so each chip is only the escaped skill name
+CHIP_PARTS = {
+    kind: (f'<span style="background:{bg};color:{fg};border:1px solid {bd};font-size:.72rem;font-weight:500;padding:2px 9px;border-radius:20px;display:inline-block;margin:2px;">', '</span>')
+    for kind, (fg, bg, bd) in CHIP_PALETTE.items()
+}
+
+@lru_cache(maxsize=512)
+def chips_html(skills, kind):
+    """Joined skill chips for a whole skill list; `skills` must be a tuple."""
+    pre, suf = CHIP_PARTS[kind]
+    return "".join(pre + html.escape(s) + suf for s in skills)
+
+@lru_cache(maxsize=4096)
+def badge(lbl, fg, bg, bd):
+    """Modern status badge with soft tones and precise typography."""
+    return f'<span style="background:{bg}; color:{fg}; border:1px solid {bd}; font-size:0.65rem; font-weight:700; padding:4px 12px; border-radius:100px; text-transform:uppercase; letter-spacing:0.04em; box-shadow: 0 1px 2px rgba(0,0,0,0.04); white-space:nowrap;">{lbl}</span>'
+
+@lru_cache(maxsize=16)
+def sidebar_pills(nr, nj):
+    """Resume/job count pills plus the assistive-scoring footnote for the sidebar."""
+    return f'<div style="display:grid;grid-template-columns:1fr 1fr;gap:8px;margin-bottom:.75rem;"><div style="background:{BLUE_LT};border:1px solid {BLUE_BD};border-radius:8px;padding:12px;text-align:center;"><div style="font-size:1.4rem;font-weight:800;color:{BLUE};">{nr}</div><div style="font-size:.65rem;color:{T3};text-transform:uppercase;letter-spacing:.07em;margin-top:3px;">Resumes</div></div><div style="background:{BLUE_LT};border:1px solid {BLUE_BD};border-radius:8px;padding:12px;text-align:center;"><div style="font-size:1.4rem;font-weight:800;color:{BLUE};">{nj}</div><div style="font-size:.65rem;color:{T3};text-transform:uppercase;letter-spacing:.07em;margin-top:3px;">Jobs</div></div></div><div style="font-size:.7rem;color:{T4};line-height:1.6;padding:0 2px;border-top:1px solid {BORDER};padding-top:.75rem;">Final decisions rest with the recruiter. Scores are assistive only.</div>'